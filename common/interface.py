@@ -1,17 +1,24 @@
+import math
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
+# Shared read-only stand-in for absent sub-objects; never handed out to callers.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Item:
     name: str
     amount: float
     quantity: float
+    # Precomputed once; a plain slot read is cheaper than a property call.
+    line_total: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def line_total(self) -> float:
-        return round(self.amount * self.quantity, 2)
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "line_total", round(self.amount * self.quantity, 2))
 
 @dataclass
 class PayloadInfo:
@@ -31,8 +38,20 @@ class PayloadInfo:
     total: Optional[float] = None
     vat: Optional[float] = None
     pre_vat: Optional[float] = None
+    # Sum of the item line totals; derived from ``items`` when not supplied.
+    items_total: Optional[float] = None
+
+    # Wall-clock ns; cheaper than building a datetime nobody may read.
+    created_ns: int = field(default_factory=time.time_ns)
 
-    created_at: datetime = field(default_factory=datetime.now)
+    def __post_init__(self) -> None:
+        if self.items_total is None:
+            self.items_total = _items_total(self.items)
+
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as a local ``datetime``, built on demand."""
+        return datetime.fromtimestamp(self.created_ns / 1e9)
 
     @classmethod
     def from_dict(cls, payload: dict[str, Any]) -> "PayloadInfo":
@@ -46,61 +65,56 @@ class PayloadInfo:
         if _is_legacy_format(payload):
             return cls.from_legacy_dict(payload)
 
+        return cls._from_normalized(
+            payload.get("header_info", {}) or {},
+            # Owned copy: the totals are written into it.
+            dict(payload.get("footer_info") or ()),
+            payload["items"],
+            payload.get("transaction_info") or _EMPTY,
+            rfid=str(payload.get("rfid", "") or ""),
+            info_title=str(payload.get("info_title", payload.get("info-title", "")) or ""),
+        )
+
+    @classmethod
+    def _from_normalized(
+        cls,
+        header_info: dict[str, Any],
+        footer_info: dict[str, Any],
+        raw_items: list[dict[str, Any]],
+        tx: Mapping[str, Any],
+        rfid: str = "",
+        info_title: str = "",
+    ) -> "PayloadInfo":
+        """Shared core of from_dict/from_legacy_dict; takes already-split sections.
+
+        ``footer_info`` must be owned by the caller as the totals are added to it.
+        """
         # parse items
+        # Local aliases keep the per-item loop off global lookups; JSON
+        # decoders already hand back floats, so only coerce ints/strings.
+        _Item, _float = Item, float
         items = [
-            Item(
-                name=i["name"],
-                amount=float(i["amount"]),
-                quantity=float(i["quantity"]),
+            _Item(
+                i["name"],
+                a if type(a := i["amount"]) is _float else _float(a),
+                q if type(q := i["quantity"]) is _float else _float(q),
             )
-            for i in payload["items"]
+            for i in raw_items
         ]
 
-        items_total = round(sum(item.line_total for item in items), 2)
+        items_total = _items_total(items)
 
         # transaction info
-        tx = payload.get("transaction_info", {}) or {}
-
         received = _to_float_or_none(tx.get("received"))
         change = _to_float_or_none(tx.get("change"))
         discount = _to_float_or_none(tx.get("discount"))
         total = _to_float_or_none(tx.get("total"))
 
-        # business rules
-        # if total not supplied -> start from items total
-        if total is None:
-            total = items_total
-
-        # if discount supplied -> apply it (discount expected positive)
-        if discount is not None and total == items_total:
-            total = items_total - discount
-
-        # if received & change known -> authoritative total
-        #    total = received - change
-        if received is not None and change is not None:
-            total = received - change
-
-        # if received & total known -> compute change
-        if received is not None and change is None:
-            change = received - total
-
-        # if change & total known -> compute received
-        if change is not None and received is None:
-            received = total + change
-
-        # if received & change known but discount missing -> infer discount
-        #    discount = total - items_total
-        if received is not None and change is not None and discount is None:
-            discount = items_total - total
-
-        # round all derived monetary values to 2 decimals
-        total = _round2(total)
-        received = _round2(received)
-        change = _round2(change)
-        discount = _round2(discount)
+        total, received, change, discount = _resolve_transaction(
+            items_total, total, received, change, discount
+        )
 
         # footer Info population
-        footer_info = payload.get("footer_info", {}) or {}
         if received is not None: footer_info["Received"] = received
         if change is not None: footer_info["Change"] = change
         if discount is not None: footer_info["Discount"] = discount
@@ -113,59 +127,93 @@ class PayloadInfo:
             pre_vat = round(total - vat, 2)
 
         return cls(
-            header_info=payload.get("header_info", {}) or {},
+            header_info=header_info,
             footer_info=footer_info,
             items=items,
-            rfid=str(payload.get("rfid", "") or ""),
-            info_title=str(payload.get("info_title", payload.get("info-title", "")) or ""),
+            rfid=rfid,
+            info_title=info_title,
             received=received,
             change=change,
             discount=discount,
             total=total,
             vat=vat,
             pre_vat=pre_vat,
+            items_total=items_total,
         )
     
     @classmethod
     def from_legacy_dict(cls, payload: dict[str, Any]) -> "PayloadInfo":
         """similar implementation as from_dict but for legacy formats"""
 
-        new_payload = {}
+        # Which legacy keys are present, computed once for all branches below.
+        present = _LEGACY_KEYS.intersection(payload)
 
         # Copy over customer info
         header_info: dict[str, Any] = {}
-        if "customer" in payload:
+        if "customer" in present:
             customer: dict[str, str] = payload["customer"]
             for key, value in customer.items():
                 label = "Customer name" if key == "name" else f"Customer {key.capitalize()}"
                 header_info[label] = value
 
         # Copy over transaction-related info to header
-        if "transection" in payload:
-            header_info["Transaction"] = payload["transection"]
-        if "promotion" in payload:
-            header_info["Promotion"] = payload["promotion"]
-        new_payload["header_info"] = header_info
-
-        # Copy over items
-        new_payload["items"] = payload["items"]
+        for key, label in _LEGACY_HEADER_MAP:
+            if key in present:
+                header_info[label] = payload[key]
 
         # Copy over footer info
         footer_info: dict[str, Any] = {}
-        if "points" in payload:
-            footer_info["Points"] = payload["points"]
-        new_payload["footer_info"] = footer_info
+        for key, label in _LEGACY_FOOTER_MAP:
+            if key in present:
+                footer_info[label] = payload[key]
 
         # Copy over transaction info
-        tx_info = {}
+        tx_info: dict[str, Any] = {}
         if "total" in payload:
             tx_info["total"] = payload["total"]
-        if "extras" in payload:
+        if "extras" in present:
             tx_info.update(payload["extras"])
-        new_payload["transaction_info"] = tx_info
 
-        return cls.from_dict(new_payload)
+        # Already normalized: go straight to the shared core, skipping the
+        # legacy check and section re-extraction of from_dict.
+        return cls._from_normalized(header_info, footer_info, payload["items"], tx_info)
+
+
+def _resolve_transaction(
+    items_total: float,
+    total: Optional[float],
+    received: Optional[float],
+    change: Optional[float],
+    discount: Optional[float],
+) -> tuple[float, Optional[float], Optional[float], Optional[float]]:
+    """Fill in the missing transaction fields (all rounded to 2 decimals).
+
+    Returns ``(total, received, change, discount)``.
+    """
+    # A supplied total is authoritative; otherwise start from the items total
+    # and apply the (positive) discount, if any.
+    if total is None:
+        total = items_total if discount is None else items_total - discount
+
+    # Dispatch once on which of received/change are known.
+    match (received is not None, change is not None):
+        case (True, True):
+            # received & change known -> authoritative total
+            total = received - change
+        case (True, False):
+            change = received - total
+        case (False, True):
+            received = total + change
 
+    # Either was supplied (both are now known) but discount missing -> infer it.
+    if received is not None and discount is None:
+        discount = items_total - total
+
+    return _round2(total), _round2(received), _round2(change), _round2(discount)
+
+def _items_total(items: list[Item]) -> float:
+    # fsum accumulates exactly, so long item lists don't drift by a cent.
+    return round(math.fsum([item.line_total for item in items]), 2)
 
 def _to_float_or_none(value) -> Optional[float]:
     if value is None:
@@ -177,5 +225,10 @@ def _round2(value: Optional[float]) -> Optional[float]:
         return None
     return round(float(value), 2)
 
+_LEGACY_KEYS = frozenset({"customer", "transection", "promotion", "points", "extras"})
+# Legacy top-level key -> header/footer label it is copied to.
+_LEGACY_HEADER_MAP = (("transection", "Transaction"), ("promotion", "Promotion"))
+_LEGACY_FOOTER_MAP = (("points", "Points"),)
+
 def _is_legacy_format(payload: dict[str, Any]) -> bool:
-    return any(key in payload for key in ["customer", "transection", "promotion", "points", "extras"])
\ No newline at end of file
+    return not _LEGACY_KEYS.isdisjoint(payload)
\ No newline at end of file
@@ -8,12 +8,17 @@ When the file is missing or unreadable, the built-in :data:`DEFAULT_DUMMY` is us
 from __future__ import annotations
 
 import json
+import os
 from copy import deepcopy
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 _DUMMY_FILE = Path(__file__).with_name("temp.dummy.json")
 
+# (st_mtime_ns, st_size, parsed payload) of the last read, so repeated loads of
+# an unchanged file (preview, test print, Reload) skip the read + JSON parse.
+_CACHE: Optional[tuple[int, int, dict[str, Any]]] = None
+
 # A full example payload that exercises every supported data field. `header_info`
 # lists all the recognized (auto-translated) keys; `transaction_info` carries all
 # four keys with self-consistent values (received - change == total). Header/footer
@@ -63,21 +68,49 @@ DEFAULT_DUMMY: dict[str, Any] = {
 
 def load() -> dict[str, Any]:
     """Return the saved dummy payload, falling back to the built-in default."""
-    if _DUMMY_FILE.exists():
-        try:
-            with _DUMMY_FILE.open("r", encoding="utf-8") as handle:
+    global _CACHE
+    # EAFP: a missing file raises FileNotFoundError (an OSError) from open(), so
+    # no separate exists() stat is needed.
+    try:
+        with _DUMMY_FILE.open("r", encoding="utf-8") as handle:
+            stat = os.fstat(handle.fileno())
+            key = (stat.st_mtime_ns, stat.st_size)
+            if _CACHE is not None and _CACHE[:2] == key:
+                data = _CACHE[2]
+            else:
                 data = json.load(handle)
-            if isinstance(data, dict):
-                return data
-        except (json.JSONDecodeError, OSError):
-            pass
+                _CACHE = (*key, data)
+        if isinstance(data, dict):
+            # Callers may mutate the payload; never hand out the cached object.
+            return _copy_payload(data)
+    except (json.JSONDecodeError, OSError):
+        pass
     return deepcopy(DEFAULT_DUMMY)
 
 
+def _copy_payload(data: dict[str, Any]) -> dict[str, Any]:
+    """Copy a payload's sections, item rows and image slots (far cheaper than a deepcopy).
+
+    Payloads nest at most three levels over scalar leaves: ``header_info``-style
+    maps, the ``items`` list of row dicts, and ``images`` slot dicts
+    (``{"header": {"src", "scale"}}``), so this is a full copy in practice.
+    """
+    out = dict(data)
+    for key, value in out.items():
+        if isinstance(value, dict):
+            out[key] = {k: dict(v) if isinstance(v, dict) else v for k, v in value.items()}
+        elif isinstance(value, list):
+            out[key] = [dict(row) if isinstance(row, dict) else row for row in value]
+    return out
+
+
 def save(data: dict[str, Any]) -> None:
     """Persist the provided dummy payload to disk."""
+    global _CACHE
     with _DUMMY_FILE.open("w", encoding="utf-8") as handle:
         json.dump(data, handle, indent=2, ensure_ascii=False)
+    # Coarse mtime resolution could let a same-size rewrite look unchanged.
+    _CACHE = None
 
 
 def get_defaults() -> dict[str, Any]:
@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import json
-from copy import deepcopy
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Plain alias (not the 3.12+ `type` statement) so this runs on Python 3.10+.
 Config = dict[str, dict[str, Any]]
@@ -53,36 +58,87 @@ _DEFAULTS: Config = {
 
 _DATA: Config = {}
 
-def _ensure_config_file() -> None:
-    if not _CONFIG_FILE.exists():
-        _write_config(_DEFAULTS)
+# (st_mtime_ns, st_size, parsed JSON) of the last read, so reload() serves an
+# unchanged file from memory instead of re-parsing it.
+_RAW_CACHE: Optional[tuple[int, int, dict[str, Any]]] = None
+
+def _loads(blob: bytes) -> Any:
+    # orjson parses the raw bytes directly, skipping the UTF-8 decode step.
+    if orjson is not None:
+        return orjson.loads(blob)
+    return json.loads(blob.decode("utf-8"))
+
+def _dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
 
 def _merge_with_defaults(raw: dict[str, Any]) -> Config:
     merged: Config = {}
     for section, defaults in _DEFAULTS.items():
-        section_values: dict[str, Any] = deepcopy(defaults)
+        # Sections are flat str -> scalar maps, so a shallow copy is a full copy.
+        section_values: dict[str, Any] = dict(defaults)
         incoming = raw.get(section)
         if isinstance(incoming, dict):
             section_values.update(incoming)
         merged[section] = section_values
     return merged
 
+def _read_fd(fd: int, size_hint: int) -> bytes:
+    chunks: list[bytes] = []
+    while chunk := os.read(fd, max(size_hint + 1, 4096)):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
 def _load_config() -> Config:
-    _ensure_config_file()
-    with _CONFIG_FILE.open("r", encoding="utf-8") as handle:
-        raw = json.load(handle)
+    global _RAW_CACHE
+    # One raw open + fstat on the descriptor: skips the separate path stat and
+    # the extra fstat/lseek that a buffered open() performs.
+    try:
+        fd = os.open(_CONFIG_FILE, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except FileNotFoundError:
+        _write_config(_DEFAULTS)
+        return _merge_with_defaults(_DEFAULTS)
+
+    try:
+        stat = os.fstat(fd)
+        key = (stat.st_mtime_ns, stat.st_size)
+        if _RAW_CACHE is not None and _RAW_CACHE[:2] == key:
+            raw = _RAW_CACHE[2]
+        else:
+            raw = _loads(_read_fd(fd, stat.st_size))
+            _RAW_CACHE = (*key, raw)
+    finally:
+        os.close(fd)
+    # The merge copies into fresh dicts, so the cached `raw` is never mutated.
     return _merge_with_defaults(raw)
 
 def _write_config(data: Config) -> None:
-    with _CONFIG_FILE.open("w", encoding="utf-8") as handle:
-        json.dump(data, handle, indent=2, ensure_ascii=False)
+    global _RAW_CACHE
+    blob = _dumps(data)
+    # Saving an unchanged tree is common (Save after a no-op edit): only rewrite
+    # the file, and bump its mtime for other readers, when the bytes differ.
+    try:
+        if _CONFIG_FILE.read_bytes() == blob:
+            return
+    except OSError:
+        pass
+    _CONFIG_FILE.write_bytes(blob)
+    # Coarse mtime resolution could let a same-size rewrite look unchanged.
+    _RAW_CACHE = None
 
 def _refresh_globals(new_data: Config) -> None:
+    # `new_data` is always a freshly merged tree owned by this module, so bind it
+    # (and its sections) by reference instead of copying it again.
     global PRINTER, LAYOUT, SERVICE, _DATA
-    _DATA = deepcopy(new_data)
-    PRINTER = deepcopy(_DATA["PRINTER"])
-    LAYOUT = deepcopy(_DATA["LAYOUT"])
-    SERVICE = deepcopy(_DATA["SERVICE"])
+    _DATA = new_data
+    PRINTER = _DATA["PRINTER"]
+    LAYOUT = _DATA["LAYOUT"]
+    SERVICE = _DATA["SERVICE"]
+
+def _copy_tree(data: Config) -> Config:
+    """Copy a two-level config tree (equivalent to a deepcopy for flat sections)."""
+    return {section: dict(values) for section, values in data.items()}
 
 def reload() -> None:
     """Reload settings from disk."""
@@ -91,11 +147,13 @@ def reload() -> None:
 
 def get_all() -> Config:
     """Return a copy of the full configuration tree."""
-    return deepcopy(_DATA)
+    if not _DATA:
+        reload()
+    return _copy_tree(_DATA)
 
 def get_defaults() -> Config:
     """Return a copy of the default configuration values."""
-    return deepcopy(_DEFAULTS)
+    return _copy_tree(_DEFAULTS)
 
 def save_all(data: Config) -> None:
     """Persist the provided configuration tree and refresh module globals."""
@@ -105,13 +163,22 @@ def save_all(data: Config) -> None:
 
 def update_section(section: str, values: dict[str, Any]) -> None:
     """Update a specific configuration section and persist it."""
-    current = get_all()
-    if section not in current:
+    if section not in _DEFAULTS:
         raise KeyError(f"Unknown settings section: {section}")
-    current[section].update(values)
+    if not _DATA:
+        reload()
+    # save_all merges into fresh dicts, so only the touched section needs a copy.
+    current = dict(_DATA)
+    current[section] = {**_DATA[section], **values}
     save_all(current)
 
-reload()
+def __getattr__(name: str) -> Any:
+    # PEP 562: PRINTER/LAYOUT/SERVICE are materialized on first access instead of
+    # reading the settings file as an import side effect.
+    if name in ("PRINTER", "LAYOUT", "SERVICE"):
+        reload()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_paper_width_options() -> list[str]:
     """Return available paper width options."""
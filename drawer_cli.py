@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import argparse
 import sys
-from copy import deepcopy
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from config import settings
 from printer.driver import ReceiptPrinter
@@ -18,14 +19,18 @@ def parse_arguments() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def configure_printer(port_override: str | None) -> dict:
-    printer_cfg = deepcopy(settings.PRINTER)
-    if port_override:
-        if ":" not in port_override:
-            raise ValueError("Port override must follow 'PORT:NAME' format")
-        port, name = port_override.split(":", 1)
-        printer_cfg["usb_port"] = port or printer_cfg.get("usb_port")
-        printer_cfg["usb_name"] = name or printer_cfg.get("usb_name")
+def configure_printer(port_override: str | None) -> Mapping[str, Any]:
+    if not port_override:
+        # Nothing to override: hand out a read-only view instead of a copy.
+        return MappingProxyType(settings.PRINTER)
+
+    if ":" not in port_override:
+        raise ValueError("Port override must follow 'PORT:NAME' format")
+    # PRINTER is a flat str -> scalar map, so a shallow copy is enough.
+    printer_cfg = dict(settings.PRINTER)
+    port, name = port_override.split(":", 1)
+    printer_cfg["usb_port"] = port or printer_cfg.get("usb_port")
+    printer_cfg["usb_name"] = name or printer_cfg.get("usb_name")
     return printer_cfg
 
 
@@ -4,37 +4,123 @@ from __future__ import annotations
 
 import importlib
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from config.settings import PRINTER
+from config import settings
 from printer.utils import get_real_path
 
-try:
+if TYPE_CHECKING:
     from PIL import Image
-except ImportError:
-    Image = ImageDraw = None
-
-try:
-    escpos_printer = importlib.import_module("escpos.printer")
-except ModuleNotFoundError:
-    escpos_printer = None
-try:
-    win32print = importlib.import_module("win32print")
-    WIN32PRINT_AVAILABLE = True
-except ModuleNotFoundError:
-    win32print = None
-    WIN32PRINT_AVAILABLE = False
+
+
+@lru_cache(maxsize=None)
+def _pil_image():
+    """Return ``PIL.Image`` (or None if Pillow is missing), imported on first use.
+
+    Only image printing needs Pillow, so the drawer CLI never pays for it.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    return Image
+
+
+@lru_cache(maxsize=None)
+def _cv2():
+    """Return ``(cv2, numpy)`` when OpenCV is installed, else None.
+
+    Optional accelerator: ``cv2.resize`` uses SIMD resamplers and is several times
+    faster than Pillow's LANCZOS on header-sized images. Pillow stays the fallback.
+    """
+    try:
+        import cv2
+        import numpy
+    except ImportError:
+        return None
+    return cv2, numpy
+
+
+@lru_cache(maxsize=None)
+def _escpos_printer():
+    """Return ``escpos.printer`` (or None if python-escpos is missing), imported on first use."""
+    try:
+        return importlib.import_module("escpos.printer")
+    except ModuleNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _win32print():
+    """Return ``win32print`` (or None off Windows / without pywin32), imported on first use.
+
+    Deferred so importing the driver for config or UI work never loads the Win32 DLLs.
+    """
+    try:
+        return importlib.import_module("win32print")
+    except ModuleNotFoundError:
+        return None
 
 LOGGER = logging.getLogger(__name__)
 
+# Raw ESC p pulses, used when the device object has no ``cashdraw``.
+_KICK_COMMANDS = {
+    2: b"\x1b\x70\x00\x19\xfa",
+    5: b"\x1b\x70\x01\x19\xfa",
+}
+# Prebuilt line feeds for the common short feeds; these skip text() encoding.
+_FEEDS = [b"\n" * lines for lines in range(9)]
+
+# Images with fewer mid-tone pixels than this fraction are thresholded, not dithered.
+_BILEVEL_MIDTONE_RATIO = 0.05
+# 128-cutoff lookup table for Image.point, the same cutoff Floyd-Steinberg uses.
+_THRESHOLD_LUT = [0] * 128 + [255] * 128
+
+# Pillow's reducing_gap: resizes shrinking by >= this factor run Image.reduce first.
+_REDUCING_GAP = 3.0
+
+# Pending bytes are pushed early past this size so a huge job can't pile up in RAM.
+_FLUSH_THRESHOLD = 64 * 1024
+
+
+@lru_cache(maxsize=None)
+def _buffered_win32raw():
+    """Return a ``Win32Raw`` subclass that batches writes until :meth:`flush`.
+
+    Stock ``Win32Raw._raw`` wraps every command in its own Start/EndPagePrinter +
+    WritePrinter, so an image sent row-band by row-band becomes dozens of tiny
+    spooler writes. Buffering turns a whole receipt into a single write.
+    """
+
+    class _BufferedWin32Raw(_escpos_printer().Win32Raw):
+        def __init__(self, *args, **kwargs) -> None:
+            self._pending = bytearray()
+            super().__init__(*args, **kwargs)
+
+        def _raw(self, msg: bytes) -> None:
+            self._pending += msg
+            if len(self._pending) >= _FLUSH_THRESHOLD:
+                self.flush()
+
+        def flush(self) -> None:
+            if not self._pending:
+                return
+            data = bytes(self._pending)
+            self._pending.clear()
+            super()._raw(data)
+
+    return _BufferedWin32Raw
+
 
 def list_printers() -> list[dict[str, str]]:
     """Return installed Windows printers as ``{"name", "port"}`` dicts.
 
     Empty list when win32print is unavailable (non-Windows or missing pywin32).
     """
-    if not WIN32PRINT_AVAILABLE:
+    win32print = _win32print()
+    if win32print is None:
         return []
 
     flags = win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS
@@ -52,7 +138,8 @@ def list_printers() -> list[dict[str, str]]:
 
 def get_printer_port(name: str) -> Optional[str]:
     """Return the port a Windows printer queue is bound to, or None."""
-    if not WIN32PRINT_AVAILABLE or not name:
+    win32print = _win32print()
+    if win32print is None or not name:
         return None
     try:
         handle = win32print.OpenPrinter(name)
@@ -75,9 +162,10 @@ def test_connection(name: str, port: str = "") -> tuple[bool, str]:
     is printed) and confirms the prerequisites for the Win32Raw driver path.
     Returns ``(ok, message)``.
     """
-    if escpos_printer is None:
+    if _escpos_printer() is None:
         return False, "python-escpos is not installed; cannot print."
-    if not WIN32PRINT_AVAILABLE:
+    win32print = _win32print()
+    if win32print is None:
         return False, "pywin32 (win32print) is not installed."
 
     name = (name or "").strip()
@@ -106,18 +194,21 @@ class ReceiptPrinter:
     """Simple wrapper around python-escpos to output UTF-8 Thai receipts."""
 
     def __init__(self, config: Optional[dict] = None) -> None:
-        self.config = config or PRINTER
+        self.config = config or settings.PRINTER
         self.device = None
         self.pixel_width = self.config.get("pixel_width", 384)
+        # Device capabilities, probed once per connection instead of per call.
+        self._cut_fn = None
+        self._cashdraw_fn = None
 
     def connect(self):
         """Connect to the configured printer using Win32Raw or fallback."""
         
         if self.device is not None:
             return self.device
-        if escpos_printer is None:
+        if _escpos_printer() is None:
             raise RuntimeError("python-escpos is not installed; cannot send data to printer")
-        if not WIN32PRINT_AVAILABLE:
+        if _win32print() is None:
             raise RuntimeError(
                 "Win32Raw printing requires the 'pywin32' package (win32print); "
                 "install it via 'pip install pywin32' and restart the service."
@@ -127,11 +218,13 @@ class ReceiptPrinter:
         usb_port = self.config.get("usb_port") or "USB001"
         try:
             # Win32Raw talks directly to a Windows printer queue by name/port.
-            self.device = escpos_printer.Win32Raw(usb_name, port=usb_port)
+            self.device = _buffered_win32raw()(usb_name, port=usb_port)
         except Exception as exc:  # pragma: no cover - hardware specific
             LOGGER.error("Unable to connect to printer %s (%s): %s", usb_name, usb_port, exc)
             raise RuntimeError("Failed to connect to USB receipt printer") from exc
 
+        self._cut_fn = getattr(self.device, "cut", None)
+        self._cashdraw_fn = getattr(self.device, "cashdraw", None)
         return self.device
 
     def print_image(self, path: str | Path | "Image.Image", scale: int = 100) -> None:
@@ -143,7 +236,8 @@ class ReceiptPrinter:
         # would be unbound here when a PIL image is passed -> UnboundLocalError).
         source = "receipt image"
 
-        if isinstance(path, Image.Image):
+        pil = _pil_image()
+        if pil is not None and isinstance(path, pil.Image):
             pil_image = path
             LOGGER.debug("Printing PIL Image object (scale=%s%%)", scale)
         else:
@@ -154,7 +248,7 @@ class ReceiptPrinter:
                 return
             LOGGER.debug("Printing image %s (scale=%s%%)", image_path, scale)
 
-            if Image is None:
+            if pil is None:
                 try:
                     device.image(str(image_path))
                 except Exception as exc:
@@ -163,7 +257,7 @@ class ReceiptPrinter:
                 return
 
             try:
-                pil_image = Image.open(image_path)
+                pil_image = pil.open(image_path)
             except Exception as exc:
                 LOGGER.error("Failed to open image %s: %s", image_path, exc)
                 raise RuntimeError("Failed to open image for printing") from exc
@@ -176,35 +270,48 @@ class ReceiptPrinter:
             LOGGER.error("Failed to print processed image %s: %s", source, exc)
             raise RuntimeError("Failed to print receipt image") from exc
 
+    def flush(self) -> None:
+        """Send everything buffered so far to the printer in one write."""
+        flush_fn = getattr(self.device, "flush", None)
+        if not callable(flush_fn):
+            return
+        try:
+            flush_fn()
+        except Exception as exc:
+            LOGGER.error("Failed to send data to printer: %s", exc)
+            raise RuntimeError("Failed to send data to printer") from exc
+
     def cut(self) -> None:
         device = self.connect()
-        try:
-            device.cut()
-        except AttributeError:
+        if self._cut_fn is not None:
+            self._cut_fn()
+        else:
             LOGGER.debug("Printer does not support cut operation; sending form feed")
             device.control("LF")
+        # The cut ends a print job; deliver it now so errors surface to the caller.
+        self.flush()
 
     def kick_drawer(self, pin: int = 2) -> None:
         """Kick the cash drawer."""
         device = self.connect()
-        try:
-            device.cashdraw(pin)
-        except AttributeError:
+        if self._cashdraw_fn is not None:
+            self._cashdraw_fn(pin)
+        else:
             LOGGER.debug("Using raw ESC/POS command for drawer kick")
-            if pin == 2:
-                device.text("\x1b\x70\x00\x19\xfa")
-            elif pin == 5:
-                device.text("\x1b\x70\x01\x19\xfa")
-            else:
+            command = _KICK_COMMANDS.get(pin)
+            if command is None:
                 raise ValueError("Invalid pin for cash drawer kick; must be 2 or 5")
+            device._raw(command)
+        self.flush()
 
     def feed(self, lines: int = 1) -> None:
         """Advance paper by the requested number of lines."""
         if lines <= 0:
             return
         device = self.connect()
+        lines = int(lines)
         try:
-            device.text("\n" * int(lines))
+            device._raw(_FEEDS[lines] if lines < len(_FEEDS) else b"\n" * lines)
         except Exception as exc:
             LOGGER.error("Failed to feed printer %s lines: %s", lines, exc)
             raise RuntimeError("Failed to feed paper") from exc
@@ -212,6 +319,10 @@ class ReceiptPrinter:
     def disconnect(self) -> None:
         if not self.device:
             return
+        try:
+            self.flush()
+        except RuntimeError:
+            LOGGER.debug("Dropping unsent printer data on disconnect", exc_info=True)
         close_fn = getattr(self.device, "close", None)
         if callable(close_fn):
             try:
@@ -219,9 +330,12 @@ class ReceiptPrinter:
             except Exception:
                 LOGGER.debug("Failed to close printer device", exc_info=True)
         self.device = None
+        self._cut_fn = None
+        self._cashdraw_fn = None
 
     def _prepare_bitmap(self, image: "Image.Image", scale: int = 100):
-        if image.mode != "L":
+        # "1" sources are already bitmaps; only re-dither them if they get resampled.
+        if image.mode not in ("L", "1"):
             image = image.convert("L")
 
         if image.width == 0 or image.height == 0:
@@ -246,18 +360,51 @@ class ReceiptPrinter:
         
         # Only resize if necessary (optimization, though float comparison might be fuzzy)
         if new_width != image.width or new_height != image.height:
-            image = image.resize((new_width, new_height), Image.LANCZOS)
-
-        image = image.convert("1")
-
-        # Center on canvas if smaller than pixel_width (it shouldn't be larger as we scaled to pixel_width max)
-        if image.width < self.pixel_width:
-            canvas = Image.new("1", (self.pixel_width, image.height), 1)
-            x_offset = max(0, (self.pixel_width - image.width) // 2)
-            canvas.paste(image, (x_offset, 0))
-            image = canvas
-
-        return image
+            if image.mode == "1":
+                image = image.convert("L")
+            image = self._resize(image, new_width, new_height)
+
+        # Centered on a pixel_width canvas (it shouldn't be larger as we scaled to pixel_width max)
+        return self._dither(image, self.pixel_width)
+
+    @staticmethod
+    def _resize(image: "Image.Image", width: int, height: int) -> "Image.Image":
+        """LANCZOS-resize an "L" image, through OpenCV when it is available."""
+        pil = _pil_image()
+        accel = _cv2()
+        if accel is None:
+            # Large downscales box-reduce by an integer factor first, then LANCZOS the rest.
+            return image.resize((width, height), pil.LANCZOS, reducing_gap=_REDUCING_GAP)
+        cv2, np = accel
+        # INTER_AREA is both faster and cleaner than Lanczos for downscales.
+        interpolation = cv2.INTER_AREA if width < image.width else cv2.INTER_LANCZOS4
+        resized = cv2.resize(np.asarray(image), (width, height), interpolation=interpolation)
+        return pil.fromarray(resized, "L")
+
+    @staticmethod
+    def _dither(image: "Image.Image", width: int) -> "Image.Image":
+        """Floyd-Steinberg an image down to "1", centered on a ``width``-wide white canvas.
+
+        Near-bilevel sources (logos, QR codes, rendered text) are thresholded with a
+        single LUT pass instead, since diffusing their few grey edge pixels buys nothing.
+        """
+        if image.mode == "1":
+            bitmap = image
+        elif ReceiptPrinter._is_bilevel(image):
+            bitmap = image.point(_THRESHOLD_LUT, "1")
+        else:
+            bitmap = image.convert("1")
+        if bitmap.width < width:
+            canvas = _pil_image().new("1", (width, bitmap.height), 1)
+            canvas.paste(bitmap, ((width - bitmap.width) // 2, 0))
+            bitmap = canvas
+        return bitmap
+
+    @staticmethod
+    def _is_bilevel(image: "Image.Image") -> bool:
+        """True when almost every pixel of an "L" image is near black or near white."""
+        midtones = sum(image.histogram()[16:240])
+        return midtones < _BILEVEL_MIDTONE_RATIO * image.width * image.height
 
 
 __all__ = ["ReceiptPrinter", "list_printers", "get_printer_port", "test_connection"]
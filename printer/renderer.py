@@ -3,6 +3,9 @@ from __future__ import annotations
 import base64
 import logging
 import math
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from io import BytesIO
 from typing import Any, Optional, TYPE_CHECKING
 from PIL import Image, ImageDraw, ImageFont
@@ -15,6 +18,12 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 
+# Header/footer titles repeat on every receipt, so their wrapped + rasterized blocks
+# are kept across renderers, keyed on (text, font file, size, widths).
+_BLOCK_CACHE: OrderedDict[tuple, tuple] = OrderedDict()
+_BLOCK_CACHE_LOCK = threading.Lock()
+_BLOCK_CACHE_SIZE = 64
+
 class DashedImageDraw(ImageDraw.ImageDraw):
     """Helper for drawing dashed lines."""
 
@@ -51,29 +60,109 @@ class DashedImageDraw(ImageDraw.ImageDraw):
 
     def dashed_line(self, xy: list[tuple[float, float]], dash=(6, 4), fill=None, width=0):
         for i in range(len(xy) - 1):
-            x1, y1 = xy[i]
-            x2, y2 = xy[i + 1]
-            x_length = x2 - x1
-            y_length = y2 - y1
-            length = math.sqrt(x_length**2 + y_length**2)
-            dash_enabled = True
-            position = 0
-            while position <= length:
-                for dash_step in dash:
-                    if position > length:
-                        break
-                    if dash_enabled:
-                        start = position / length
-                        end = min((position + dash_step - 1) / length, 1)
-                        self.thick_line(
-                            [
-                                (round(x1 + start * x_length), round(y1 + start * y_length)),
-                                (round(x1 + end * x_length), round(y1 + end * y_length))
-                            ],
-                            xy, fill, width
-                        )
-                    dash_enabled = not dash_enabled
-                    position += dash_step
+            for segment in _dash_segments(tuple(xy[i]), tuple(xy[i + 1]), tuple(dash)):
+                self.thick_line(list(segment), xy, fill, width)
+
+@lru_cache(maxsize=16)
+def _dash_segments(
+    p1: tuple[float, float], p2: tuple[float, float], dash: tuple[int, ...]
+) -> tuple[tuple[tuple[int, int], tuple[int, int]], ...]:
+    """Pixel endpoints of the "on" dashes from ``p1`` to ``p2``, memoized.
+
+    Every receipt draws the same few full-width dividers, so the per-dash float
+    arithmetic runs once per geometry rather than once per divider.
+    """
+    x1, y1 = p1
+    x2, y2 = p2
+    x_length = x2 - x1
+    y_length = y2 - y1
+    length = math.sqrt(x_length**2 + y_length**2)
+    segments = []
+    dash_enabled = True
+    position = 0
+    while position <= length:
+        for dash_step in dash:
+            if position > length:
+                break
+            if dash_enabled:
+                start = position / length
+                end = min((position + dash_step - 1) / length, 1)
+                segments.append((
+                    (round(x1 + start * x_length), round(y1 + start * y_length)),
+                    (round(x1 + end * x_length), round(y1 + end * y_length))
+                ))
+            dash_enabled = not dash_enabled
+            position += dash_step
+    return tuple(segments)
+
+@lru_cache(maxsize=8)
+def _divider_mask(width: int, padding: int) -> tuple[Image.Image, int]:
+    """The receipt's horizontal dashed divider as ``(mask, pad)``, drawn once per width.
+
+    Painting black through ``mask`` at ``y - pad`` gives the same pixels as
+    drawing the dashed line at ``y``.
+    """
+    pad = 4
+    mask = Image.new("L", (width, 2 * pad + 1), 0)
+    DashedImageDraw(mask).dashed_line([(padding, pad), (width - padding, pad)], fill=255, width=2)
+    return mask, pad
+
+@lru_cache(maxsize=32)
+def _truetype(path: str, size: int) -> ImageFont.ImageFont:
+    """Load a TrueType font once per (path, size); the default bitmap font if it fails.
+
+    Every receipt builds a new renderer, so without this each one re-reads and
+    re-parses the font file.
+    """
+    try:
+        return ImageFont.truetype(path, size)
+    except IOError:
+        return ImageFont.load_default()
+
+@lru_cache(maxsize=4096)
+def _text_length(font: ImageFont.ImageFont, text: str) -> float:
+    """``font.getlength(text)``, memoized; item names and labels repeat across receipts."""
+    return font.getlength(text)
+
+@lru_cache(maxsize=4096)
+def _text_bbox(font: ImageFont.ImageFont, text: str) -> tuple[int, int, int, int]:
+    """``font.getbbox(text)``, memoized alongside :func:`_text_length`."""
+    return font.getbbox(text)
+
+@lru_cache(maxsize=256)
+def _text_tile(font: ImageFont.ImageFont, text: str) -> tuple[Optional[Image.Image], int, int]:
+    """Rasterize one line of text as ``(coverage_mask, dx, dy)``, memoized.
+
+    Pasting black through the mask at ``(x + dx, y + dy)`` matches
+    ``draw.text((x, y), text, fill=0)``; column labels, totals and repeated item
+    values then skip FreeType after their first receipt.
+    """
+    x0, y0, x1, y1 = font.getbbox(text)
+    if x1 <= x0 or y1 <= y0:
+        return None, 0, 0
+    # A pixel of slack on every side in case antialiasing spills past the bbox.
+    left, top = min(x0, 0) - 1, min(y0, 0) - 1
+    mask = Image.new("L", (x1 - left + 1, y1 - top + 1), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+    return mask, left, top
+
+@lru_cache(maxsize=64)
+def _line_steps(font: ImageFont.ImageFont) -> tuple[int, int]:
+    """``(text_step, column_step)``: line advances for wrapped text blocks and table rows.
+
+    Text blocks are sized from the tall Thai cluster "ผู้", table rows from "A".
+    """
+    bbox = font.getbbox("ผู้")
+    bbox_a = font.getbbox("A")
+    column_step = (bbox_a[3] - bbox_a[1]) + 4 if bbox_a else 19
+    return bbox[3] - bbox[1] + 6, column_step
+
+def _multiline_spacing(draw: ImageDraw.ImageDraw, font: ImageFont.ImageFont, step: int) -> int:
+    """``spacing`` for ``multiline_text`` so consecutive baselines land ``step`` px apart.
+
+    Pillow advances each line by the height of "A" plus ``spacing``.
+    """
+    return step - draw.textbbox((0, 0), "A", font=font)[3]
 
 class ReceiptRenderer:
     """Handles the generation of receipt images."""
@@ -96,17 +185,17 @@ class ReceiptRenderer:
         self.body_font = self._load_font(self.font_path, p_font_small)
 
         # Initialize canvas
-        # Determine height dynamically - start large
-        self.temp_h = 2000
-        self.im = Image.new("L", (self.target_width, self.temp_h), 255)
+        # render() lays the receipt out twice: a measuring pass that only advances y,
+        # then a drawing pass on a canvas allocated at the measured height.
+        self.measuring = False
+        self.im = Image.new("L", (self.target_width, 1), 255)
         self.draw = DashedImageDraw(self.im)
         self.y = self.V_PADDING
+        # Header/footer images, loaded and fitted once and shared by both passes.
+        self._images: dict[tuple[str, int], Optional[Image.Image]] = {}
 
     def _load_font(self, path: str, size: int) -> ImageFont.ImageFont:
-        try:
-            return ImageFont.truetype(path, size)
-        except IOError:
-            return ImageFont.load_default()
+        return _truetype(str(path), size)
 
     def wrap_text(self, text: str, font: ImageFont.ImageFont, max_width: int) -> list[str]:
         """Wrap text to fit max_width, respecting explicit newlines."""
@@ -115,26 +204,38 @@ class ReceiptRenderer:
 
         lines = []
         paragraphs = text.split("\n")
+        space_w = _text_length(font, " ")
 
         for paragraph in paragraphs:
-            if font.getlength(paragraph) <= max_width:
+            if _text_length(font, paragraph) <= max_width:
                 lines.append(paragraph)
                 continue
 
             words = paragraph.split(" ")
             current_line = []
+            current_w = 0.0
 
             for word in words:
-                test_line = " ".join(current_line + [word])
-                if font.getlength(test_line) <= max_width:
+                word_w = _text_length(font, word)
+                # Grow the width additively; only re-measure the joined line near the
+                # limit, where kerning across the space could tip the decision.
+                estimate = current_w + space_w + word_w if current_line else word_w
+                if estimate < max_width - 1:
+                    fits = True
+                else:
+                    fits = font.getlength(" ".join(current_line + [word])) <= max_width
+                if fits:
                     current_line.append(word)
+                    current_w = estimate
                 else:
                     if current_line:
                         lines.append(" ".join(current_line))
                         current_line = [word]
+                        current_w = word_w
                     else:
                         lines.append(word)
                         current_line = []
+                        current_w = 0.0
 
             if current_line:
                 lines.append(" ".join(current_line))
@@ -146,17 +247,41 @@ class ReceiptRenderer:
             return
 
         max_w = self.target_width - (2 * self.PADDING)
+        path, size = getattr(font, "path", None), getattr(font, "size", None)
+        key = (text, path, size, self.target_width, max_w) if path else None
+        with _BLOCK_CACHE_LOCK:
+            cached = _BLOCK_CACHE.get(key) if key else None
+            if cached is not None:
+                _BLOCK_CACHE.move_to_end(key)
+        if cached is None:
+            cached = self._centered_block(text, font, max_w)
+            if key:
+                with _BLOCK_CACHE_LOCK:
+                    _BLOCK_CACHE[key] = cached
+                    if len(_BLOCK_CACHE) > _BLOCK_CACHE_SIZE:
+                        _BLOCK_CACHE.popitem(last=False)
+
+        mask, pad, advance = cached
+        if mask is not None and not self.measuring:
+            # Painting black through the coverage mask composites exactly like draw.text.
+            self.im.paste(0, (0, self.y - pad), mask)
+        self.y += advance
+
+    def _centered_block(self, text: str, font: ImageFont.ImageFont, max_w: int) -> tuple:
+        """Rasterize centered, wrapped text as ``(coverage_mask, top_pad, y_advance)``."""
         lines = self.wrap_text(text, font, max_w)
-
-        for line in lines:
-            length = font.getlength(line)
-            x = (self.target_width - length) // 2
-            self.draw.text((x, self.y), line, font=font, fill=0)
-
-            bbox = font.getbbox("ผู้")
-            h = bbox[3] - bbox[1]
-
-            self.y += h + 6
+        if not lines:
+            return None, 0, 0
+
+        step = _line_steps(font)[0]
+        # Headroom so marks above the line box and descenders below aren't clipped.
+        pad = step
+        mask = Image.new("L", (self.target_width, len(lines) * step + 2 * pad), 0)
+        draw = ImageDraw.Draw(mask)
+        for i, line in enumerate(lines):
+            x = (self.target_width - font.getlength(line)) // 2
+            draw.text((x, pad + i * step), line, font=font, fill=255)
+        return mask, pad, len(lines) * step
 
     def draw_left_text(self, text: str, font: ImageFont.ImageFont) -> None:
         if not text:
@@ -164,30 +289,39 @@ class ReceiptRenderer:
 
         max_w = self.target_width - (2 * self.PADDING)
         lines = self.wrap_text(text, font, max_w)
+        if not lines:
+            return
 
-        for line in lines:
-            self.draw.text((self.PADDING, self.y), line, font=font, fill=0)
+        step = _line_steps(font)[0]
 
-            bbox = font.getbbox("ผู้")
-            h = bbox[3] - bbox[1]
+        # Left-aligned lines share one x, so the whole block is one multiline call.
+        if not self.measuring:
+            self.draw.multiline_text(
+                (self.PADDING, self.y), "\n".join(lines), font=font, fill=0,
+                spacing=_multiline_spacing(self.draw, font, step),
+            )
+        self.y += len(lines) * step
 
-            self.y += h + 6
+    def _paste_text(self, xy: tuple[int, int], text: str, font: ImageFont.ImageFont) -> None:
+        """Draw one line of black text at integer ``xy`` from the shared tile cache."""
+        if self.measuring:
+            return
+        mask, dx, dy = _text_tile(font, text)
+        if mask is not None:
+            self.im.paste(0, (xy[0] + dx, xy[1] + dy), mask)
 
     def draw_keyvalue_text(self, key: str, value: Any) -> None:
         if not key or not value: return
-        self.draw.text((self.PADDING, self.y), key, font=self.body_font, fill=0)
+        self._paste_text((self.PADDING, self.y), key, self.body_font)
         value_str = str(value)
         bbox = self.draw.textbbox((0, 0), value_str, font=self.body_font)
         th = bbox[3] - bbox[1]
         tw = bbox[2] - bbox[0]
-        self.draw.text((self.target_width - self.PADDING - tw, self.y), value_str, font=self.body_font, fill=0)
+        self._paste_text((self.target_width - self.PADDING - tw, self.y), value_str, self.body_font)
         self.y += th + 10
 
     def draw_3_columns(self, col1: str, col2: str, col3: str, font: Optional[ImageFont.ImageFont] = None) -> None:
         """Draw text in 3 columns with 5:1:2 ratio."""
-        if font is None:
-            font = self.body_font
-
         # Calculate column widths
         available_width = self.target_width - (2 * self.PADDING)
         col1_w = int(available_width * (5 / 8))
@@ -195,49 +329,13 @@ class ReceiptRenderer:
         # col3 gets the remaining to avoid rounding gaps
         col3_w = available_width - col1_w - col2_w
 
-        # Wrap text for each column
-        col1_lines = self.wrap_text(str(col1), font, col1_w)
-        col2_lines = self.wrap_text(str(col2), font, col2_w)
-        col3_lines = self.wrap_text(str(col3), font, col3_w)
-
-        max_lines = max(len(col1_lines), len(col2_lines), len(col3_lines))
-        
-        # Calculate line height
-        bbox_a = font.getbbox("A")
-        line_height = (bbox_a[3] - bbox_a[1]) + 4 if bbox_a else 19
-
-        for i in range(max_lines):
-            cur_y = self.y + (i * line_height)
-            
-            # Column 1 (Left aligned)
-            if i < len(col1_lines):
-                self.draw.text((self.PADDING, cur_y), col1_lines[i], font=font, fill=0)
-            
-            # Column 2 (Center aligned in its box)
-            if i < len(col2_lines):
-                c2_text = col2_lines[i]
-                c2_bbox = font.getbbox(c2_text)
-                c2_text_w = c2_bbox[2] - c2_bbox[0]
-                # Center position: Start of Col2 + (Col2 Width - Text Width) / 2
-                c2_x = self.PADDING + col1_w + (col2_w - c2_text_w) // 2
-                self.draw.text((c2_x, cur_y), c2_text, font=font, fill=0)
-
-            # Column 3 (Right aligned in its box)
-            if i < len(col3_lines):
-                c3_text = col3_lines[i]
-                c3_bbox = font.getbbox(c3_text)
-                c3_text_w = c3_bbox[2] - c3_bbox[0]
-                # Right position: End of Col3 - Text Width
-                c3_x = self.target_width - self.PADDING - c3_text_w
-                self.draw.text((c3_x, cur_y), c3_text, font=font, fill=0)
-
-        self.y += max_lines * line_height
+        self._draw_columns(
+            [(col1, col1_w, "left"), (col2, col2_w, "center"), (col3, col3_w, "right")],
+            font or self.body_font,
+        )
 
     def draw_4_columns(self, col1: str, col2: str, col3: str, col4: str, font: Optional[ImageFont.ImageFont] = None) -> None:
         """Draw text in 4 columns with 3:1.5:1.5:2 ratio."""
-        if font is None:
-            font = self.body_font
-
         # Calculate column widths (total 8 units)
         available_width = self.target_width - (2 * self.PADDING)
         col1_w = int(available_width * (3 / 8))
@@ -246,53 +344,49 @@ class ReceiptRenderer:
         # col4 gets the remaining to avoid rounding gaps
         col4_w = available_width - col1_w - col2_w - col3_w
 
-        # Wrap text for each column
-        col1_lines = self.wrap_text(str(col1), font, col1_w)
-        col2_lines = self.wrap_text(str(col2), font, col2_w)
-        col3_lines = self.wrap_text(str(col3), font, col3_w)
-        col4_lines = self.wrap_text(str(col4), font, col4_w)
-
-        max_lines = max(len(col1_lines), len(col2_lines), len(col3_lines), len(col4_lines))
-
-        # Calculate line height
-        bbox_a = font.getbbox("A")
-        line_height = (bbox_a[3] - bbox_a[1]) + 4 if bbox_a else 19
-
-        for i in range(max_lines):
-            cur_y = self.y + (i * line_height)
-
-            # Column 1 (Left aligned)
-            if i < len(col1_lines):
-                self.draw.text((self.PADDING, cur_y), col1_lines[i], font=font, fill=0)
-
-            # Column 2 (Center aligned)
-            if i < len(col2_lines):
-                c2_text = col2_lines[i]
-                c2_bbox = font.getbbox(c2_text)
-                c2_text_w = c2_bbox[2] - c2_bbox[0]
-                c2_x = self.PADDING + col1_w + (col2_w - c2_text_w) // 2
-                self.draw.text((c2_x, cur_y), c2_text, font=font, fill=0)
-
-            # Column 3 (Center aligned)
-            if i < len(col3_lines):
-                c3_text = col3_lines[i]
-                c3_bbox = font.getbbox(c3_text)
-                c3_text_w = c3_bbox[2] - c3_bbox[0]
-                c3_x = self.PADDING + col1_w + col2_w + (col3_w - c3_text_w) // 2
-                self.draw.text((c3_x, cur_y), c3_text, font=font, fill=0)
-
-            # Column 4 (Right aligned)
-            if i < len(col4_lines):
-                c4_text = col4_lines[i]
-                c4_bbox = font.getbbox(c4_text)
-                c4_text_w = c4_bbox[2] - c4_bbox[0]
-                c4_x = self.target_width - self.PADDING - c4_text_w
-                self.draw.text((c4_x, cur_y), c4_text, font=font, fill=0)
+        self._draw_columns(
+            [(col1, col1_w, "left"), (col2, col2_w, "center"), (col3, col3_w, "center"), (col4, col4_w, "right")],
+            font or self.body_font,
+        )
+
+    def _draw_columns(self, columns: list[tuple[Any, int, str]], font: ImageFont.ImageFont) -> None:
+        """Draw ``(text, width, align)`` columns side by side, each wrapped to its width.
+
+        Every line's x offset is worked out before any drawing, so the draw loop is a
+        plain sweep of cached text-tile pastes.
+        """
+        line_height = _line_steps(font)[1]
+
+        placed: list[tuple[int, int, str]] = []
+        max_lines = 0
+        col_x = self.PADDING
+        for text, col_w, align in columns:
+            lines = self.wrap_text(str(text), font, col_w)
+            max_lines = max(max_lines, len(lines))
+            for i, line in enumerate(lines):
+                if align == "left":
+                    x = col_x
+                else:
+                    bbox = _text_bbox(font, line)
+                    text_w = bbox[2] - bbox[0]
+                    # Center in the column box, or flush against the paper's right edge
+                    if align == "center":
+                        x = col_x + (col_w - text_w) // 2
+                    else:
+                        x = self.target_width - self.PADDING - text_w
+                placed.append((x, i, line))
+            col_x += col_w
+
+        for x, i, line in placed:
+            self._paste_text((x, self.y + i * line_height), line, font)
 
         self.y += max_lines * line_height
 
     def draw_dashed_line(self) -> None:
-        self.draw.dashed_line([(self.PADDING, self.y), (self.target_width - self.PADDING, self.y)], fill=0, width=2)
+        if self.measuring:
+            return
+        mask, pad = _divider_mask(self.target_width, self.PADDING)
+        self.im.paste(0, (0, self.y - pad), mask)
 
     def _open_image_source(self, src: str) -> Image.Image:
         """Open an image from a file path, a data: URI, or a raw base64 string."""
@@ -316,27 +410,41 @@ class ReceiptRenderer:
         if not img_path:
             return
 
+        key = (img_path, scale)
+        if key not in self._images:
+            self._images[key] = self._fit_image(img_path, scale)
+        h_img = self._images[key]
+        if h_img is None:
+            return
+
+        if not self.measuring:
+            x = (self.target_width - h_img.width) // 2
+            self.im.paste(h_img, (x, self.y), h_img)
+        self.y += h_img.height + 10
+
+    def _fit_image(self, img_path: str, scale: int) -> Optional[Image.Image]:
+        """Load an image as "LA", fitted to the paper width and then scaled; None on failure."""
         try:
             with self._open_image_source(img_path) as h_img:
                 h_img = h_img.convert("LA")
                 base_w = self.target_width - (2 * self.PADDING)
                 if base_w <= 0:
-                    return
+                    return None
 
                 ratio = base_w / h_img.width
                 h_h = int(h_img.height * ratio)
-                h_img = h_img.resize((base_w, h_h), Image.Resampling.LANCZOS)
+                # reducing_gap box-reduces 2x/3x logo exports before the LANCZOS pass.
+                h_img = h_img.resize((base_w, h_h), Image.Resampling.LANCZOS, reducing_gap=3.0)
 
                 if scale != 100:
                     target_w = int(base_w * (scale / 100.0))
                     target_h = int(h_h * (scale / 100.0))
                     h_img = h_img.resize((max(1, target_w), max(1, target_h)), Image.Resampling.LANCZOS)
 
-                x = (self.target_width - h_img.width) // 2
-                self.im.paste(h_img, (x, self.y), h_img)
-                self.y += h_img.height + 10
+                return h_img
         except Exception as e:
             LOGGER.warning(f"Failed to load image {img_path}: {e}")
+            return None
 
     def render(
         self, 
@@ -348,8 +456,25 @@ class ReceiptRenderer:
         if locale is None:
             locale = LocaleEN()  # Default to English if no locale provided
 
-        # Calculate total
-        total = sum(float(item.line_total) for item in info.items)
+        # Measure first so the canvas is allocated at its final height: no oversized
+        # buffer, no crop copy, and no clipping of receipts taller than a guess.
+        self.measuring = True
+        self.y = self.V_PADDING
+        self._layout(info, locale)
+        final_h = max(40, self.y)
+
+        self.measuring = False
+        self.im = Image.new("L", (self.target_width, final_h), 255)
+        self.draw = DashedImageDraw(self.im)
+        self.y = self.V_PADDING
+        self._layout(info, locale)
+        return self.im
+
+    def _layout(self, info: PayloadInfo, locale: Locale) -> None:
+        """Run the receipt's draw sequence top to bottom, advancing ``self.y``."""
+
+        # Items total, already summed (exactly, via fsum) when the payload was parsed
+        total = info.items_total
 
         # RFID (top-left, small font)
         if info.rfid:
@@ -459,9 +584,6 @@ class ReceiptRenderer:
         self.draw_image(self.config.get("footer_image"), int(self.config.get("footer_image_scale", 100)))
 
         self.y += self.BOTTOM_PADDING
-        
-        final_h = max(40, self.y)
-        return self.im.crop((0, 0, self.target_width, final_h))
 
 def generate_receipt_image(
     config: dict[str, Any],
@@ -482,10 +604,7 @@ def render_text_block(text: str, width: int = 384, font_path: str = "", font_siz
     if not text:
         return Image.new("1", (width, 10), 255)
 
-    try:
-        font = ImageFont.truetype(font_path, font_size) if font_path else ImageFont.load_default()
-    except IOError:
-        font = ImageFont.load_default()
+    font = _truetype(font_path, font_size) if font_path else ImageFont.load_default()
 
     lines = text.splitlines()
     line_h = font_size + 6
@@ -495,8 +614,8 @@ def render_text_block(text: str, width: int = 384, font_path: str = "", font_siz
     draw = ImageDraw.Draw(im)
     y = 10
 
-    for line in lines:
-        draw.text((0, y), line, font=font, fill=0)
-        y += line_h
+    draw.multiline_text((0, y), "\n".join(lines), font=font, fill=0,
+                        spacing=_multiline_spacing(draw, font, line_h))
+    y += len(lines) * line_h
 
     return im.crop((0, 0, width, y + 10))
@@ -1,13 +1,9 @@
 """Shared helpers for receipt payload validation and rendering."""
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import Any
 
-from config.settings import (
-    PRINTER as DEFAULT_PRINTER,
-    LAYOUT as DEFAULT_LAYOUT
-)
+from config import settings
 from printer import utils
 
 
@@ -147,7 +143,8 @@ def apply_payload_images(layout: dict[str, Any], images: dict[str, Any] | None)
 
 
 def build_receipt_text(data: dict[str, Any], layout_overrides: dict[str, Any] | None = None) -> str:
-    layout = deepcopy(DEFAULT_LAYOUT)
+    # Layout values are flat scalars, so a shallow copy is a full copy.
+    layout = dict(settings.LAYOUT)
     if layout_overrides:
         layout.update({k: v for k, v in layout_overrides.items() if v is not None})
 
@@ -209,7 +206,7 @@ def build_info_page() -> str:
     blocks.append(utils.add_line(utils.align_center("Test page")))
     blocks.append(utils.add_empty_line())
 
-    printer_cfg = deepcopy(DEFAULT_PRINTER)
+    printer_cfg = dict(settings.PRINTER)
     for key, value in printer_cfg.items():
         blocks.append(utils.add_line(key, right_text=str(value)))
 
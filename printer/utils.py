@@ -5,20 +5,19 @@ import textwrap
 from typing import Iterable, List
 from pathlib import Path
 
-from config.settings import LAYOUT, PRINTER
+from config import settings
 
 ALIGN_LEFT_TOKEN = "<<L>>"
 ALIGN_CENTER_TOKEN = "<<C>>"
 ALIGN_RIGHT_TOKEN = "<<R>>"
 SMALL_TEXT_TOKEN = "<<SM>>"
 
-LINE_WIDTH = PRINTER.get("line_width", 32)
-CURRENCY = LAYOUT.get("currency", "บาท")
-VOLUME_UNIT = LAYOUT.get("volume_unit", "ลิตร")
 
+def _currency() -> str:
+    return settings.LAYOUT.get("currency", "บาท")
 
 def _ensure_width(width: int | None = None) -> int:
-    return width or LINE_WIDTH
+    return width or settings.PRINTER.get("line_width", 32)
 
 def wrap_text(text: str, width: int | None = None) -> List[str]:
     width = _ensure_width(width)
@@ -78,15 +77,17 @@ def format_item(name: str, price_per_liter: float, liters: float) -> str:
     lines: List[str] = []
     for wrapped in wrap_text(name):
         lines.append(add_line(wrapped))
-    price_text = f"{liters:.2f} {VOLUME_UNIT} × {price_per_liter:.2f} {CURRENCY}"
+    currency = _currency()
+    volume_unit = settings.LAYOUT.get("volume_unit", "ลิตร")
+    price_text = f"{liters:.2f} {volume_unit} × {price_per_liter:.2f} {currency}"
     lines.append(add_line(price_text))
     subtotal = price_per_liter * liters
-    lines.append(add_line(f"= {subtotal:.2f} {CURRENCY}"))
+    lines.append(add_line(f"= {subtotal:.2f} {currency}"))
     return "".join(lines)
 
 def format_total(value: float) -> str:
     label = "รวมทั้งหมด"
-    amount = f"{value:.2f} {CURRENCY}"
+    amount = f"{value:.2f} {_currency()}"
     width = _ensure_width(None)
     spacing = width - len(label) - len(amount)
     spacing = max(1, spacing)
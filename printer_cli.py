@@ -5,9 +5,10 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Sequence
 
 from common import updater
 from config import settings
@@ -15,13 +16,18 @@ from l10n import LocaleEN, LocaleTH
 from printer.driver import ReceiptPrinter
 from printer.renderer import generate_receipt_image
 from printer.template import validate_payload, apply_payload_images
-from server.app import create_app
 from ui.actions import print_preview
-from ui.web.app import launch_config
 from common.interface import PayloadInfo
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def parse_arguments() -> argparse.Namespace:
+
+@lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once; it is stateless across parse calls."""
     parser = argparse.ArgumentParser(
         prog="printer", 
         description="USB receipt printer CLI"
@@ -71,7 +77,11 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--payload",
         required=False,
-        help="JSON payload string or path to a JSON file matching the /print body",
+        action="append",
+        help=(
+            "JSON payload string or path to a JSON file matching the /print body; "
+            "repeat to print several receipts in one run"
+        ),
     )
     parser.add_argument(
         "--locale",
@@ -121,23 +131,50 @@ def parse_arguments() -> argparse.Namespace:
         action="store_true",
         help="Skip the confirmation prompt for --update",
     )
-    return parser.parse_args()
+    return parser
+
+def parse_arguments(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    return _get_parser().parse_args(argv)
+
+def _parse_json(data: str | bytes) -> Any:
+    # orjson parses file bytes without a separate UTF-8 decode pass; its
+    # JSONDecodeError subclasses the stdlib one, so callers catch either.
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _is_inline_json(payload_arg: str) -> bool:
+    return payload_arg.lstrip()[:1] in ("{", "[")
 
 def load_payload(payload_arg: str) -> dict:
-    path = Path(payload_arg)
-    if path.exists():
+    # Inline JSON is the common case: parse it without probing the filesystem.
+    if _is_inline_json(payload_arg):
+        try:
+            return _parse_json(payload_arg)
+        except json.JSONDecodeError as exc:
+            raise ValueError("Payload must be valid JSON or a readable JSON file path") from exc
+
+    try:
+        raw = Path(payload_arg).read_bytes()
+    except (OSError, ValueError):  # missing, a directory, or not a valid path at all
+        raw = None
+    if raw is not None:
         try:
-            with path.open("r", encoding="utf-8") as handle:
-                return json.load(handle)
+            return _parse_json(raw)
         except json.JSONDecodeError as exc:
             raise ValueError(f"Failed to parse JSON file: {exc}") from exc
     try:
-        return json.loads(payload_arg)
+        return _parse_json(payload_arg)
     except json.JSONDecodeError as exc:
         raise ValueError("Payload must be valid JSON or a readable JSON file path") from exc
 
-def configure_printer(port_override: Optional[str], paper_width: Optional[str] = None) -> dict:
-    printer_cfg = deepcopy(settings.PRINTER)
+def configure_printer(port_override: Optional[str], paper_width: Optional[str] = None) -> Mapping[str, Any]:
+    if not port_override and not paper_width:
+        # Nothing to override: hand out a read-only view instead of a copy.
+        return MappingProxyType(settings.PRINTER)
+
+    # PRINTER is a flat str -> scalar map, so a shallow copy is enough.
+    printer_cfg = dict(settings.PRINTER)
     if port_override:
         if ":" not in port_override:
             raise ValueError("Port override must follow 'PORT:NAME' format")
@@ -152,31 +189,32 @@ def configure_printer(port_override: Optional[str], paper_width: Optional[str] =
         settings.apply_paper_width({"PRINTER": printer_cfg}, paper_width_key)
     return printer_cfg
 
+# Layout keys overridable from the CLI; each flag's `dest` matches its key.
+_STRING_OVERRIDES = (
+    "header_image",
+    "header_title",
+    "header_description",
+    "receipt_title",
+    "footer_label",
+    "footer_image",
+)
+_SCALE_OVERRIDES = ("header_image_scale", "footer_image_scale")
+
 def build_layout(args: argparse.Namespace, payload_images: Optional[dict] = None) -> dict:
-    layout = deepcopy(settings.LAYOUT)
+    layout = dict(settings.LAYOUT)
 
     # Payload images sit below CLI flags in precedence.
     apply_payload_images(layout, payload_images)
 
     # String overrides: skip when empty/None.
-    overrides = {
-        "header_image": args.header_image,
-        "header_title": args.header_title,
-        "header_description": args.header_description,
-        "receipt_title": args.receipt_title,
-        "footer_label": args.footer_label,
-        "footer_image": args.footer_image,
-    }
-    for key, value in overrides.items():
+    for key in _STRING_OVERRIDES:
+        value = getattr(args, key)
         if value:
             layout[key] = value
 
     # Numeric scale overrides: 0 is valid, so check `is not None`.
-    scale_overrides = {
-        "header_image_scale": args.header_image_scale,
-        "footer_image_scale": args.footer_image_scale,
-    }
-    for key, value in scale_overrides.items():
+    for key in _SCALE_OVERRIDES:
+        value = getattr(args, key)
         if value is not None:
             if not 0 <= value <= 100:
                 raise ValueError(f"{key} must be between 0 and 100")
@@ -236,10 +274,14 @@ def run_update(assume_yes: bool = False) -> int:
     return 0
 
 
-def main() -> int:
-    args = parse_arguments()
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_arguments(argv)
 
+    # The UI (pywebview/pywin32) and server (Flask) stacks are imported only by
+    # the modes that use them, so a plain print doesn't pay for them at startup.
     if args.config:
+        from ui.web.app import launch_config
+
         launch_config(minimized=args.minimized)
         return 0
 
@@ -253,15 +295,14 @@ def main() -> int:
             print(f"[ERROR] {exc}", file=sys.stderr)
             return 2
 
+        from server.app import create_app
+
         app = create_app()
         debug = settings.SERVICE.get("debug", False)
         app.run(host=host, port=port, debug=debug)
         return 0
     
-    # Default to the configured receipt locale (Layout -> receipt_locale), matching
-    # the /print server, unless the caller explicitly passes --locale.
-    locale_code = args.locale or settings.LAYOUT.get("receipt_locale", "en")
-    locale = LocaleTH() if locale_code == "th" else LocaleEN()
+    locale = _resolve_locale(args)
     if args.test:
         try:
             print_preview()
@@ -276,21 +317,62 @@ def main() -> int:
         print("[ERROR] --payload is required unless --config or --test is used", file=sys.stderr)
         return 2
 
+    # Repeated --payload flags print in order with one set of options; identical
+    # inline JSON is parsed and validated once. Exit with the worst status seen.
+    status = 0
+    for payload_arg in args.payload:
+        status = max(status, _print_payload(args, payload_arg, locale))
+    return status
+
+
+def _resolve_locale(args: argparse.Namespace):
+    # Default to the configured receipt locale (Layout -> receipt_locale), matching
+    # the /print server, unless the caller explicitly passes --locale.
+    locale_code = args.locale or settings.LAYOUT.get("receipt_locale", "en")
+    return LocaleTH() if locale_code == "th" else LocaleEN()
+
+
+def _parse_and_validate(payload_arg: str) -> tuple[PayloadInfo, dict]:
+    """Parse + validate a payload argument into a fresh ``(PayloadInfo, images)``.
+
+    Validation of inline JSON is memoized on the raw string; file paths are
+    re-read on every call so edits between in-process prints are picked up.
+    """
+    if _is_inline_json(payload_arg):
+        cached = _validate_inline(payload_arg)
+        # The cached dict is shared: copy the parts PayloadInfo keeps or callers get.
+        validated = dict(cached, header_info=dict(cached["header_info"]))
+        images = {slot: dict(entry) for slot, entry in cached["images"].items()}
+    else:
+        validated = validate_payload(load_payload(payload_arg))
+        images = validated["images"]
+    return PayloadInfo.from_dict(validated), images
+
+
+@lru_cache(maxsize=64)
+def _validate_inline(payload_arg: str) -> dict:
+    """Memoized validated inline JSON; errors propagate and are not cached.
+
+    Hits share the returned dict, so only :func:`_parse_and_validate` may call
+    this (it copies what it hands out).
+    """
+    return validate_payload(load_payload(payload_arg))
+
+
+def _print_payload(args: argparse.Namespace, payload_arg: str, locale) -> int:
     try:
-        payload = load_payload(args.payload)
-        validated = validate_payload(payload)
+        info, images = _parse_and_validate(payload_arg)
     except ValueError as exc:
         print(f"[ERROR] {exc}", file=sys.stderr)
         return 2
 
     try:
-        layout = build_layout(args, validated.get("images"))
+        layout = build_layout(args, images)
         printer_config = configure_printer(args.port, args.paper_width)
     except ValueError as exc:
         print(f"[ERROR] {exc}", file=sys.stderr)
         return 2
 
-    info = PayloadInfo.from_dict(validated)
     img = generate_receipt_image(
         layout, 
         info,
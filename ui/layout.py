@@ -43,8 +43,9 @@ def separator() -> FieldSpec:
 def choice(label: str, key: str) -> FieldSpec:
     return (key, label, dict)
 
-FIELD_SPECS: dict[str, list[FieldSpec]] = {
-    "LAYOUT": [
+# The field tables below are read-only, so they are frozen (tuples/frozensets).
+FIELD_SPECS: dict[str, tuple[FieldSpec, ...]] = {
+    "LAYOUT": (
         entry("Header Image", "header_image"),
         slider("Image Scale (%)", "header_image_scale"),
         entry("Header Title", "header_title"),
@@ -61,80 +62,80 @@ FIELD_SPECS: dict[str, list[FieldSpec]] = {
         slider("Line Spacing", "line_spacing"),
         entry("Currency", "currency"),
         entry("Volume Unit", "volume_unit"),
-    ],
-    "PRINTER": [
+    ),
+    "PRINTER": (
         entry("Printer", "usb_name"),
         entry("USB Port", "usb_port"),
         choice("Paper Width", "paper_width"),
         separator(),
         button("Get Drivers", "open_driver_downloads_page", primary=True),
-    ],
-    "SERVICE": [
+    ),
+    "SERVICE": (
         entry("Host", "host"),
         entry("Port", "port"),
         separator(),
         checkbox("Debug Mode", "debug"),
-    ],
+    ),
     # Editable example payload for the preview / test print. Rendered by a custom
     # panel in the UI (see UI._build_dummy_section), so it has no flat fields here.
-    "DUMMY": [],
+    "DUMMY": (),
 }
 
 FILE_PICKER_FIELDS: dict[tuple[str, str], dict[str, Any]] = {
     ("LAYOUT", "font_path"): {
         "title": "Select font file",
-        "filetypes": [
+        "filetypes": (
             ("Font Files", "*.ttf *.otf *.ttc"),
             ("All Files", "*.*"),
-        ],
+        ),
     },
     ("LAYOUT", "header_image"): {
         "title": "Select header image",
-        "filetypes": [
+        "filetypes": (
             ("Image Files", "*.png *.jpg *.jpeg *.bmp"),
             ("All Files", "*.*"),
-        ],
+        ),
     },
     ("LAYOUT", "footer_image"): {
         "title": "Select footer image",
-        "filetypes": [
+        "filetypes": (
             ("Image Files", "*.png *.jpg *.jpeg *.bmp"),
             ("All Files", "*.*"),
-        ],
+        ),
     },
 }
 
-MULTILINE_FIELDS = {
+MULTILINE_FIELDS = frozenset({
     ("LAYOUT", "header_title"),
     ("LAYOUT", "header_description"),
     ("LAYOUT", "receipt_title"),
     ("LAYOUT", "footer_label"),
-}
+})
 
-IMAGE_FIELDS = {
+IMAGE_FIELDS = frozenset({
     ("LAYOUT", "header_image"),
     ("LAYOUT", "footer_image"),
-}
+})
 
-SCALE_FIELDS = {
+SCALE_FIELDS = frozenset({
     ("LAYOUT", "font_size"),
     ("LAYOUT", "font_size_small"),
     ("LAYOUT", "line_spacing"),
-}
+})
 
-CHOICE_FIELDS = {
+CHOICE_FIELDS = frozenset({
     ("PRINTER", "paper_width"),
-}
+})
 
 # Rendered as a dropdown of installed printers + a manual add panel.
-PRINTER_SELECT_FIELDS = {
+PRINTER_SELECT_FIELDS = frozenset({
     ("PRINTER", "usb_name"),
-}
+})
 
 # Rendered read-only; auto-populated from the selected printer.
-PRINTER_PORT_FIELDS = {
+PRINTER_PORT_FIELDS = frozenset({
     ("PRINTER", "usb_port"),
-}
+})
 
 __all__ = [
     "FieldSpec",
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import base64
 import threading
+from functools import lru_cache
 from io import BytesIO
 from typing import Any, Callable, Optional
 
@@ -40,6 +41,28 @@ def _locale_for(code: Optional[str]):
     return LocaleTH() if code == "th" else LocaleEN()
 
 
+@lru_cache(maxsize=16)
+def _thumb_data_url(path: str, size: int, stamp: tuple) -> str:
+    """Decode + downscale an image to a PNG data URL (memoized; errors propagate).
+
+    ``stamp`` only participates in the cache key.
+    """
+    from PIL import Image
+
+    from printer.utils import get_real_path
+
+    if path.startswith("data:"):
+        _, _, b64 = path.partition(",")
+        img = Image.open(BytesIO(base64.b64decode(b64)))
+    else:
+        img = Image.open(get_real_path(path))
+    img = img.convert("RGBA")
+    img.thumbnail((size, size))
+    buf = BytesIO()
+    img.save(buf, format="PNG")
+    return "data:image/png;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+
+
 class Api:
     """Bridge object passed to ``webview.create_window(js_api=...)``."""
 
@@ -48,6 +71,8 @@ class Api:
         self.dirty = False
         self.allow_close = False
         self._quit_cb: Optional[Callable[[bool], None]] = None
+        # pywebview runs each js_api call on its own thread; one print at a time.
+        self._print_lock = threading.Lock()
 
     def bind_window(self, window: "webview.Window") -> None:
         """Attach the created window so native dialogs can be opened."""
@@ -164,6 +189,8 @@ class Api:
         Uses the live (possibly unsaved) config and payload when provided so it
         matches what the preview shows; falls back to saved settings/dummy.
         """
+        if not self._print_lock.acquire(blocking=False):
+            return {"ok": False, "error": "A test print is already in progress"}
         try:
             cfg = config or settings.get_all()
             printer_cfg = cfg.get("PRINTER", {})
@@ -180,6 +207,8 @@ class Api:
             return {"ok": True}
         except Exception as exc:
             return {"ok": False, "error": str(exc)}
+        finally:
+            self._print_lock.release()
 
     # -- Image thumbnail (resolves relative paths / base64 to a data URL) -
 
@@ -193,21 +222,15 @@ class Api:
         if not path:
             return ""
         try:
-            from PIL import Image
-
             from printer.utils import get_real_path
 
             if path.startswith("data:"):
-                _, _, b64 = path.partition(",")
-                src = BytesIO(base64.b64decode(b64))
-                img = Image.open(src)
+                stamp: tuple = ()
             else:
-                img = Image.open(get_real_path(path))
-            img = img.convert("RGBA")
-            img.thumbnail((int(size), int(size)))
-            buf = BytesIO()
-            img.save(buf, format="PNG")
-            return "data:image/png;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+                # Key file thumbnails on mtime/size so an edited image is re-read.
+                st = get_real_path(path).stat()
+                stamp = (st.st_mtime_ns, st.st_size)
+            return _thumb_data_url(path, int(size), stamp)
         except Exception:
             return ""
 
@@ -218,12 +241,7 @@ class Api:
         if self._window is None:
             return ""
         section, _, key = field.partition("|")
-        meta = FILE_PICKER_FIELDS.get((section, key))
-        file_types: tuple[str, ...] = ()
-        if meta:
-            file_types = tuple(
-                _to_webview_filetype(ft) for ft in meta.get("filetypes", [])
-            )
+        file_types = _DIALOG_FILE_TYPES.get((section, key), ())
         try:
             result = self._window.create_file_dialog(
                 webview.OPEN_DIALOG, file_types=file_types
@@ -259,7 +277,7 @@ class Api:
             # but closing the window only hides to the tray — so force a full quit.
             # Brief delay lets the JS response/toast render first.
             if self._quit_cb:
-                t = threading.Timer(0.6, lambda: self._quit_cb(True))
+                t = threading.Timer(0.6, self._quit_cb, args=(True,))
                 t.daemon = True
                 t.start()
             return {"ok": True}
@@ -313,3 +331,10 @@ def _to_webview_filetype(ft: Any) -> str:
     label, pattern = ft[0], ft[1]
     exts = ";".join(str(pattern).split())
     return f"{label} ({exts})"
+
+
+# pywebview filter strings per file field, converted once from the static table.
+_DIALOG_FILE_TYPES: dict[tuple[str, str], tuple[str, ...]] = {
+    field: tuple(_to_webview_filetype(ft) for ft in meta.get("filetypes", ()))
+    for field, meta in FILE_PICKER_FIELDS.items()
+}
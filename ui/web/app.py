@@ -18,6 +18,7 @@ import sys
 import threading
 import time
 from ctypes import wintypes
+from functools import lru_cache
 from pathlib import Path
 
 import webview
@@ -64,6 +65,15 @@ def _colorref(hex_color: str) -> int:
     return (b << 16) | (g << 8) | r
 
 
+# Title-bar DWM attributes, resolved once (the theme colours are constants).
+_TITLEBAR_ATTRS = (
+    (_DWMWA_CAPTION_COLOR, _colorref(NAV_BG)),
+    (_DWMWA_TEXT_COLOR, _colorref(NAV_ACTIVE_TEXT)),
+    (_DWMWA_BORDER_COLOR, _colorref(WINDOW_BORDER)),
+    (_DWMWA_WINDOW_CORNER_PREFERENCE, _DWMWCP_ROUND),
+)
+
+
 def _find_hwnd(title: str = WINDOW_TITLE, timeout_steps: int = 100) -> int:
     user32 = ctypes.windll.user32
     for _ in range(timeout_steps):
@@ -289,19 +299,27 @@ def _set_window_appid(hwnd: int) -> None:
         pass
 
 
+@lru_cache(maxsize=1)
+def _window_icons() -> tuple:
+    """Load the (big, small) HICONs once; the handles live for the whole process."""
+    user32 = ctypes.windll.user32
+    user32.LoadImageW.restype = ctypes.c_void_p
+    image_icon, lr_loadfromfile, lr_defaultsize = 1, 0x0010, 0x0040
+    big = user32.LoadImageW(None, str(_ICON), image_icon, 0, 0, lr_loadfromfile | lr_defaultsize)
+    small = user32.LoadImageW(None, str(_ICON), image_icon, 16, 16, lr_loadfromfile)
+    return big, small
+
+
 def _set_window_icon(hwnd: int) -> None:
     """Set the title-bar + taskbar icon from assets/icon.ico."""
     if not _ICON.exists():
         return
     user32 = ctypes.windll.user32
-    user32.LoadImageW.restype = ctypes.c_void_p
     user32.SendMessageW.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_void_p, ctypes.c_void_p]
-    image_icon, lr_loadfromfile, lr_defaultsize = 1, 0x0010, 0x0040
     wm_seticon, icon_small, icon_big = 0x0080, 0, 1
     set_class = getattr(user32, "SetClassLongPtrW", user32.SetClassLongW)
     set_class.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p]
-    big = user32.LoadImageW(None, str(_ICON), image_icon, 0, 0, lr_loadfromfile | lr_defaultsize)
-    small = user32.LoadImageW(None, str(_ICON), image_icon, 16, 16, lr_loadfromfile)
+    big, small = _window_icons()
     if big:
         user32.SendMessageW(hwnd, wm_seticon, icon_big, big)
         set_class(hwnd, -14, big)
@@ -317,15 +335,11 @@ def _apply_titlebar_theme(window=None) -> None:
         if not hwnd:
             return
         place_window(hwnd)
-        dwm = ctypes.windll.dwmapi
-
-        def set_attr(attr: int, value: int) -> None:
-            dwm.DwmSetWindowAttribute(hwnd, attr, ctypes.byref(ctypes.c_int(value)), 4)
-
-        set_attr(_DWMWA_CAPTION_COLOR, _colorref(NAV_BG))
-        set_attr(_DWMWA_TEXT_COLOR, _colorref(NAV_ACTIVE_TEXT))
-        set_attr(_DWMWA_BORDER_COLOR, _colorref(WINDOW_BORDER))
-        set_attr(_DWMWA_WINDOW_CORNER_PREFERENCE, _DWMWCP_ROUND)
+        set_attr = ctypes.windll.dwmapi.DwmSetWindowAttribute
+        value = ctypes.c_int()
+        for attr, v in _TITLEBAR_ATTRS:
+            value.value = v
+            set_attr(hwnd, attr, ctypes.byref(value), 4)
         _set_window_icon(hwnd)
         _set_window_appid(hwnd)
     except Exception:
@@ -410,12 +424,25 @@ def launch(minimized: bool = False) -> None:
             except Exception:
                 pass
 
-    window.events.loaded += lambda: threading.Thread(target=_reveal, daemon=True).start()
+    def _reveal_async():
+        threading.Thread(target=_reveal, daemon=True).start()
+
+    window.events.loaded += _reveal_async
     # Fallback so the window can never stay invisible if 'loaded' doesn't fire.
-    threading.Timer(3.0, lambda: threading.Thread(target=_reveal, daemon=True).start()).start()
+    threading.Timer(3.0, _reveal_async).start()
 
     # Live log lines -> in-app console (history is also kept in log_bridge.RING).
-    def _sink(lines):
+    # A burst of records (one per request) is coalesced into a single evaluate_js
+    # round-trip instead of one bridge call per line.
+    pending: list = []
+    pending_lock = threading.Lock()
+
+    def _flush_lines():
+        with pending_lock:
+            lines = pending[:]
+            pending.clear()
+        if not lines or state["force_quit"]:
+            return
         try:
             window.evaluate_js(
                 "window.App && App.service && App.service._push(%s)" % json.dumps(lines)
@@ -423,6 +450,13 @@ def launch(minimized: bool = False) -> None:
         except Exception:
             pass
 
+    def _sink(lines):
+        with pending_lock:
+            first = not pending
+            pending.extend(lines)
+        if first:
+            threading.Timer(0.05, _flush_lines).start()
+
     log_bridge.set_sink(_sink)
 
     def _show_main():
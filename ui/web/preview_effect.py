@@ -30,34 +30,32 @@ def apply_paper_effect(content_img: Image.Image) -> Image.Image:
 
     final_im = Image.new("RGBA", (target_w + 1, target_h), (0, 0, 0, 0))
 
-    points = []
-    points.append((0, 0))
+    half = tooth_w / 2
+    bottom = target_h - tooth_h
+    points = [(0, 0)]
     for i in range(0, target_w, tooth_w):
-        points.append((i + tooth_w / 2, tooth_h))
-        points.append((i + tooth_w, 0))
+        points += ((i + half, tooth_h), (i + tooth_w, 0))
 
     points.append((target_w, target_h))
     for i in range(target_w, 0, -tooth_w):
-        points.append((i - tooth_w / 2, target_h - tooth_h))
-        points.append((i - tooth_w, target_h))
+        points += ((i - half, bottom), (i - tooth_w, target_h))
     points.append((0, 0))
 
     mask = Image.new("L", (target_w + 1, target_h), 0)
     mask_draw = ImageDraw.Draw(mask)
     mask_draw.polygon(points, fill=255)
 
-    white_paper = Image.new("RGBA", (target_w + 1, target_h), (255, 255, 255, 255))
-    final_im.paste(white_paper, (0, 0), mask)
+    # Fill through the mask with a solid colour; no full-size white layer needed.
+    final_im.paste((255, 255, 255, 255), (0, 0, target_w + 1, target_h), mask)
 
     content_rgba = content_img.convert("RGBA")
     content_x = (target_w - content_img.width) // 2
     final_im.paste(content_rgba, (content_x, V_PADDING), content_rgba)
 
-    outline_layer = Image.new("RGBA", (target_w + 1, target_h), (0, 0, 0, 0))
-    outline_draw = ImageDraw.Draw(outline_layer)
+    # The edge colour is opaque, so drawing it directly matches compositing a
+    # separate outline layer, minus that layer's allocation.
+    outline_draw = ImageDraw.Draw(final_im)
     edge_color = (200, 200, 200, 255)
 
     outline_draw.line(points, fill=edge_color, width=2)
-
-    final_im.alpha_composite(outline_layer)
     return final_im
@@ -8,20 +8,43 @@ from __future__ import annotations
 
 import atexit
 import ctypes
+from ctypes import wintypes
 from typing import Optional
 
 _MUTEX_NAME = "Global\\PrinterConfigMutex"
+_ERROR_ALREADY_EXISTS = 183
+
+_k32 = None
+
+
+def _kernel32():
+    """kernel32 with pinned prototypes (so x64 handles aren't truncated), loaded once.
+
+    A private ``WinDLL`` instance keeps these argtypes from leaking into other
+    ``ctypes.windll.kernel32`` users, and ``use_last_error`` makes the
+    ERROR_ALREADY_EXISTS check reliable across the ctypes call boundary.
+    """
+    global _k32
+    if _k32 is None:
+        k32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        k32.CreateMutexW.argtypes = [ctypes.c_void_p, wintypes.BOOL, wintypes.LPCWSTR]
+        k32.CreateMutexW.restype = wintypes.HANDLE
+        for name in ("CloseHandle", "ReleaseMutex"):
+            fn = getattr(k32, name)
+            fn.argtypes = [wintypes.HANDLE]
+            fn.restype = wintypes.BOOL
+        _k32 = k32
+    return _k32
 
 
 def _acquire_mutex() -> Optional[int]:
     """Create the named mutex; return its handle, or None if already held/failed."""
     try:
-        k32 = ctypes.windll.kernel32
+        k32 = _kernel32()
         handle = k32.CreateMutexW(None, False, _MUTEX_NAME)
         if not handle:
             return None
-        already = k32.GetLastError() == 183  # ERROR_ALREADY_EXISTS
-        if already:
+        if ctypes.get_last_error() == _ERROR_ALREADY_EXISTS:
             k32.CloseHandle(handle)
             return None
         return handle
@@ -49,5 +72,5 @@ def ensure_single_instance(window_title: str) -> bool:
             pass
         return False
 
-    atexit.register(lambda: ctypes.windll.kernel32.ReleaseMutex(mutex) if mutex else None)
+    atexit.register(_kernel32().ReleaseMutex, mutex)
     return True
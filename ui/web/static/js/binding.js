@@ -8,13 +8,25 @@ window.App = window.App || {};
 
   const sectionOf = (node) => node.closest('[data-section]').dataset.section;
 
-  function coerce(inp) {
-    if (inp.type === 'checkbox') return inp.checked;
-    if (inp.dataset.type === 'int' || inp.type === 'range') {
+  // Value readers by control kind; bindInput() picks one per control up front
+  // instead of re-testing the control's type on every input event.
+  const READERS = {
+    bool: (inp) => inp.checked,
+    int: (inp) => {
       const n = parseInt(inp.value, 10);
       return isNaN(n) ? 0 : n;
-    }
-    return inp.value;
+    },
+    // Sliders always hold a valid in-range number; let the browser hand it over
+    // natively instead of re-parsing the string.
+    range: (inp) => inp.valueAsNumber,
+    str: (inp) => inp.value,
+  };
+
+  function readerFor(inp) {
+    if (inp.type === 'checkbox') return READERS.bool;
+    if (inp.type === 'range') return READERS.range;
+    if (inp.dataset.type === 'int') return READERS.int;
+    return READERS.str;
   }
 
   function updateReadout(inp) {
@@ -26,16 +38,34 @@ window.App = window.App || {};
   function loadInput(inp) {
     const val = S().getField(sectionOf(inp), inp.dataset.key);
     if (inp.type === 'checkbox') inp.checked = !!val;
-    else inp.value = val == null ? '' : val;
+    else {
+      // Leave unchanged controls alone: rewriting .value resets the caret/selection
+      // (and a textarea's scroll) even when the text is identical.
+      const next = val == null ? '' : String(val);
+      if (inp.value !== next) inp.value = next;
+    }
     updateReadout(inp);
   }
 
   function bindInput(inp) {
     loadInput(inp);
     const ev = inp.tagName === 'SELECT' || inp.type === 'checkbox' ? 'change' : 'input';
-    inp.addEventListener(ev, () => {
-      S().setField(sectionOf(inp), inp.dataset.key, coerce(inp));
+    const read = readerFor(inp);
+    const section = sectionOf(inp);
+    const key = inp.dataset.key;
+    const sync = () => {
+      const value = read(inp);
+      if (value === S().getField(section, key)) return; // nothing changed
+      S().setField(section, key, value);
       updateReadout(inp);
+    };
+    if (inp.tagName !== 'TEXTAREA') { inp.addEventListener(ev, sync); return; }
+    // Multiline fields: fold a burst of keystrokes into one state write per frame.
+    let queued = false;
+    inp.addEventListener(ev, () => {
+      if (queued) return;
+      queued = true;
+      requestAnimationFrame(() => { queued = false; sync(); });
     });
   }
 
@@ -101,20 +131,28 @@ window.App = window.App || {};
     });
   }
 
+  // Bound controls, collected once in init() so reload() doesn't re-run the selectors.
+  let inputs = [];
+  let segments = [];
+  let images = [];
+
   // Re-sync every control from config (after Cancel/Reset).
   function reload() {
-    document.querySelectorAll('.form-section [data-key]:not(#printer-select)').forEach(loadInput);
-    document.querySelectorAll('.form-section .segmented[data-key]').forEach(loadSegmented);
-    document.querySelectorAll('.form-section .image-field').forEach((f) => f._refresh && f._refresh());
+    inputs.forEach(loadInput);
+    segments.forEach(loadSegmented);
+    images.forEach((f) => f._refresh && f._refresh());
     if (App.printer && App.printer.reload) App.printer.reload();
   }
 
   function init() {
     document.querySelectorAll('[data-icon]').forEach((b) => b.prepend(icon(b.dataset.icon)));
     // The printer <select> is owned by printer.js (runtime options + port sync).
-    document.querySelectorAll('.form-section [data-key]:not(#printer-select)').forEach(bindInput);
-    document.querySelectorAll('.form-section .segmented[data-key]').forEach(bindSegmented);
-    document.querySelectorAll('.form-section .image-field[data-image]').forEach(bindImage);
+    inputs = Array.from(document.querySelectorAll('.form-section [data-key]:not(#printer-select)'));
+    segments = Array.from(document.querySelectorAll('.form-section .segmented[data-key]'));
+    images = Array.from(document.querySelectorAll('.form-section .image-field[data-image]'));
+    inputs.forEach(bindInput);
+    segments.forEach(bindSegmented);
+    images.forEach(bindImage);
     document.querySelectorAll('.form-section .file-row[data-filepicker]').forEach(bindFilePicker);
 
     const actions = { 'open-drivers': () => App.bridge.call('open_drivers') };
@@ -98,12 +98,12 @@ window.App = window.App || {};
     return { rowToggle, bulk };
   }
 
-  function buildCard(editor, title, hint) {
+  function buildCard(parent, title, hint) {
     const card = tpl('tpl-dummy-card');
     card.querySelector('.dummy-card-title').textContent = title;
     const h = card.querySelector('.dummy-card-hint');
     if (hint) h.textContent = hint; else h.remove();
-    editor.append(card);
+    parent.append(card);
     return { card, bulkCb: card.querySelector('[data-bulk]') };
   }
 
@@ -116,13 +116,16 @@ window.App = window.App || {};
       const editor = document.getElementById('dummy-editor');
       const data = S().dummy || {};
       clear(editor);
+      // Build every card off-document and attach once, so the rows don't each
+      // trigger style/layout work on the live editor.
+      const frag = document.createDocumentFragment();
       const sync = () => S().setDummy(self.collect());
       this._sync = sync;
 
       // ---- Key/Value table (header_info / footer_info) ----------------
       function kvCard(title, hint, initial) {
         const group = makeToggleGroup(sync);
-        const { card, bulkCb } = buildCard(editor, title, hint);
+        const { card, bulkCb } = buildCard(frag, title, hint);
         group.bulk(bulkCb);
         const rows = [];
         card.append(tpl('tpl-kv-head'));
@@ -179,7 +182,7 @@ window.App = window.App || {};
       // ---- Items table ------------------------------------------------
       function itemsCard(initialItems) {
         const group = makeToggleGroup(sync);
-        const { card, bulkCb } = buildCard(editor, 'Items', 'name · price/unit · quantity');
+        const { card, bulkCb } = buildCard(frag, 'Items', 'name · price/unit · quantity');
         group.bulk(bulkCb);
         const rows = [];
         card.append(tpl('tpl-item-head'));
@@ -240,7 +243,7 @@ window.App = window.App || {};
       // ---- Fixed-key cards (receipt / transaction) --------------------
       function fixedCard(title, hint, specs) {
         const group = makeToggleGroup(sync);
-        const { card, bulkCb } = buildCard(editor, title, hint);
+        const { card, bulkCb } = buildCard(frag, title, hint);
         group.bulk(bulkCb);
         const body = el('div', 'dummy-rows');
         card.append(body);
@@ -277,6 +280,7 @@ window.App = window.App || {};
         { key: 'total', label: 'Total', value: numStr((data.transaction_info || {}).total) },
       ]);
 
+      editor.append(frag);
       this._mounted = true;
       if (App.preview) App.preview.refreshNow();
     },
@@ -18,10 +18,30 @@ window.App = window.App || {};
     if (previewable() && previewMQ.matches && App.preview) App.preview.request();
   }
 
+  // Sections are static markup: look them up once and only flip visibility.
+  let navItems = null;
+  let formSections = null;
+  let shownSection = null;
+  function showSection(sec, on) {
+    navItems.forEach((b) => { if (b.dataset.section === sec) b.classList.toggle('active', on); });
+    formSections.forEach((s) => { if (s.dataset.section === sec) s.toggleAttribute('hidden', !on); });
+  }
   function selectSection(sec) {
+    if (sec === shownSection) return;
+    const prev = shownSection;
+    shownSection = sec;
     S.activeSection = sec;
-    document.querySelectorAll('.nav-item').forEach((b) => b.classList.toggle('active', b.dataset.section === sec));
-    document.querySelectorAll('.form-section').forEach((s) => s.toggleAttribute('hidden', s.dataset.section !== sec));
+    if (prev === null) {
+      // First call: sync everything with the markup's initial state.
+      navItems = document.querySelectorAll('.nav-item');
+      formSections = document.querySelectorAll('.form-section');
+      navItems.forEach((b) => b.classList.toggle('active', b.dataset.section === sec));
+      formSections.forEach((s) => s.toggleAttribute('hidden', s.dataset.section !== sec));
+    } else {
+      // Afterwards only the outgoing and incoming section change state.
+      showSection(prev, false);
+      showSection(sec, true);
+    }
     document.getElementById('section-title').textContent = titleCase(sec);
     document.getElementById('dummy-actions').toggleAttribute('hidden', sec !== 'DUMMY');
     if (App.dummy) App.dummy._mounted = sec === 'DUMMY';
@@ -29,15 +49,19 @@ window.App = window.App || {};
     refreshScrollShadows();
   }
 
+  // Runs on every state change; only touch the DOM/bridge when the flag flips.
   let lastDirty = null;
+  let saveBtn = null;
+  let cancelBtn = null;
   function updateDirty() {
     const dirty = S.isDirty();
-    document.getElementById('save-btn').disabled = !dirty;
-    document.getElementById('cancel-btn').disabled = !dirty;
-    if (dirty !== lastDirty) {
-      lastDirty = dirty;
-      App.bridge.call('set_dirty', dirty);
-    }
+    if (dirty === lastDirty) return;
+    lastDirty = dirty;
+    saveBtn = saveBtn || document.getElementById('save-btn');
+    cancelBtn = cancelBtn || document.getElementById('cancel-btn');
+    saveBtn.disabled = !dirty;
+    cancelBtn.disabled = !dirty;
+    App.bridge.call('set_dirty', dirty);
   }
 
   async function save() {
@@ -58,9 +82,12 @@ window.App = window.App || {};
   }
 
   function revert() {
+    // Only rebuild the dummy editor when its rows actually change; otherwise the
+    // existing widgets already show the (unchanged) baseline.
+    const dummyChanged = S.dummyDirty();
     S.revert();
     App.binding.reload();
-    if (App.dummy) App.dummy.render();
+    if (App.dummy && dummyChanged) App.dummy.render();
     updateDirty();
     if (App.preview) App.preview.request();
   }
@@ -72,7 +99,7 @@ window.App = window.App || {};
     );
     if (!ok) return;
     const defaults = await App.bridge.call('get_config_defaults');
-    S.config = App.clone(defaults);
+    S.replaceConfig(App.clone(defaults));
     App.binding.reload();
     updateDirty();
     if (App.preview) App.preview.request();
@@ -123,8 +150,19 @@ window.App = window.App || {};
     const scroll = typeof scrollEl === 'string' ? document.getElementById(scrollEl) : scrollEl;
     const header = document.querySelector(headerSel);
     if (!scroll || !header) return;
-    const update = () => header.classList.toggle('scrolled', scroll.scrollTop > 0);
-    scroll.addEventListener('scroll', update, { passive: true });
+    let shown = null;
+    const update = () => {
+      const on = scroll.scrollTop > 0;
+      if (on !== shown) header.classList.toggle('scrolled', (shown = on));
+    };
+    // Scroll events fire many times per frame; read scrollTop at most once a frame.
+    let queued = false;
+    const onScroll = () => {
+      if (queued) return;
+      queued = true;
+      requestAnimationFrame(() => { queued = false; update(); });
+    };
+    scroll.addEventListener('scroll', onScroll, { passive: true });
     scrollShadowUpdaters.push(update);
     update();
   }
@@ -156,7 +194,7 @@ window.App = window.App || {};
 
   async function init() {
     await App.bridge.ready;
-    S.config = await App.bridge.call('get_config');
+    S.replaceConfig(await App.bridge.call('get_config'));
     S.commitConfig();
     S.dummy = await App.bridge.call('get_dummy');
     if (App.dummy) S.dummy = App.dummy.normalize(S.dummy);
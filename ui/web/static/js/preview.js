@@ -10,7 +10,12 @@ window.App = window.App || {};
   let reqId = 0;
   let lastHash = null;
   let lastPng = null;
+  // Recently rendered PNGs by input hash, so flipping back to an earlier state
+  // (locale toggle, Cancel, undoing an edit) reuses its pixels instead of a render.
+  const pngCache = new Map();
+  const PNG_CACHE_MAX = 8;
   let printBtn = null;
+  let btnWidth = null; // last width applied to printBtn
   let localeToggle = null;
 
   function setLocale(code) {
@@ -32,7 +37,14 @@ window.App = window.App || {};
       { okLabel: 'Print', cancelLabel: 'Cancel' }
     );
     if (!ok) return;
-    const res = await App.bridge.call('test_print', S().config, currentPayload(), S().locale || 'en');
+    // The print runs on a bridge thread; keep the button off until it returns.
+    if (printBtn) printBtn.disabled = true;
+    let res;
+    try {
+      res = await App.bridge.call('test_print', S().config, currentPayload(), S().locale || 'en');
+    } finally {
+      if (printBtn) printBtn.disabled = false;
+    }
     if (res && res.ok === false) App.dom.toast(res.error || 'Print failed', 'error');
     else App.dom.toast('Test receipt sent to printer', 'success');
   }
@@ -44,7 +56,12 @@ window.App = window.App || {};
     const img = el('img');
     img.addEventListener('load', () => {
       requestAnimationFrame(() => {
-        if (printBtn) printBtn.style.width = Math.round(img.getBoundingClientRect().width) + 'px';
+        if (!printBtn) return;
+        // Receipts usually keep their width across edits; skip the no-op style write.
+        const w = Math.round(img.getBoundingClientRect().width);
+        if (w === btnWidth) return;
+        btnWidth = w;
+        printBtn.style.width = w + 'px';
       });
     });
     img.src = src;
@@ -67,6 +84,14 @@ window.App = window.App || {};
     const hash = JSON.stringify([layout, payload, locale]);
     if (!force && hash === lastHash) return;
     lastHash = hash;
+    if (!force && pngCache.has(hash)) {
+      ++reqId; // supersede any render still in flight
+      lastPng = pngCache.get(hash);
+      pngCache.delete(hash); // re-insert as most recently used
+      pngCache.set(hash, lastPng);
+      showImage(lastPng);
+      return;
+    }
     const myId = ++reqId;
     let res;
     try {
@@ -80,6 +105,9 @@ window.App = window.App || {};
       return;
     }
     lastPng = res.png;
+    pngCache.delete(hash);
+    pngCache.set(hash, res.png);
+    if (pngCache.size > PNG_CACHE_MAX) pngCache.delete(pngCache.keys().next().value);
     showImage(res.png);
   }
 
@@ -11,6 +11,10 @@ window.App = window.App || {};
   let busy = false;
   let pollTimer = null;
   const MAX_LINES = 2000;
+  // Cached console state, so appending doesn't re-query the DOM or force a layout
+  // read per batch: whether any line is shown, and whether the view follows the tail.
+  let hasLines = false;
+  let pinned = true;
 
   // ---- Log line classification -------------------------------------------
   const HTTP_RE = /"(GET|POST|PUT|DELETE|PATCH|HEAD|OPTIONS)\s[^"]*"\s(\d{3})/;
@@ -58,20 +62,27 @@ window.App = window.App || {};
   function appendLines(raw) {
     if (!body) return;
     let lines = raw.map((l) => l.replace(ANSI_RE, ''));
-    const empty = body.querySelector('.console-empty');
-    if (empty) empty.remove();
-    // Drop leading blank lines so the console starts at the first real output.
-    if (!body.querySelector('.log-line')) {
+    if (!hasLines) {
+      const empty = body.querySelector('.console-empty');
+      if (empty) empty.remove();
+      // Drop leading blank lines so the console starts at the first real output.
       while (lines.length && lines[0].trim() === '') lines = lines.slice(1);
     }
     if (!lines.length) return;
-    const atBottom = body.scrollTop + body.clientHeight >= body.scrollHeight - 6;
     const frag = document.createDocumentFragment();
     lines.forEach((ln) => frag.append(renderLine(ln)));
     body.append(frag);
+    hasLines = true;
     // Trim the buffer so a long-running service can't grow the DOM unbounded.
     while (body.childElementCount > MAX_LINES) body.firstElementChild.remove();
-    if (atBottom) body.scrollTop = body.scrollHeight;
+    if (pinned) body.scrollTop = body.scrollHeight;
+  }
+
+  function clearConsole() {
+    if (!body) return;
+    clear(body);
+    hasLines = false;
+    pinned = true;
   }
 
   function setRunning(state, info) {
@@ -120,7 +131,7 @@ window.App = window.App || {};
 
   App.service = {
     _push(lines) { appendLines(lines); },
-    _reset() { if (body) clear(body); },
+    _reset() { clearConsole(); },
     refresh: refreshStatus,
 
     async init() {
@@ -128,7 +139,11 @@ window.App = window.App || {};
       stateEl = document.getElementById('service-state');
       body = document.getElementById('service-console');
       toggleBtn.addEventListener('click', onToggle);
-      document.getElementById('console-clear').addEventListener('click', () => clear(body));
+      document.getElementById('console-clear').addEventListener('click', clearConsole);
+      // Follow the tail only while the user is scrolled to (near) the bottom.
+      body.addEventListener('scroll', () => {
+        pinned = body.scrollTop + body.clientHeight >= body.scrollHeight - 6;
+      }, { passive: true });
 
       // Seed the console with buffered log history, then stream live lines.
       const hist = await App.bridge.call('attach_console');
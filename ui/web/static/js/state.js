@@ -16,13 +16,25 @@ window.App = window.App || {};
     activeSection: 'LAYOUT',
     locale: 'en',
     _listeners: [],
+    // Per-field dirty tracking: an edit only compares the one field it touched.
+    _dirtyKeys: new Set(), // 'SECTION.key' of fields that differ from baseline
+    _configStale: true, // config replaced wholesale -> fall back to a full compare
 
     setField(section, key, value) {
       if (!this.config[section]) this.config[section] = {};
       this.config[section][key] = value;
+      const base = (this.baseline && this.baseline[section]) || {};
+      const id = section + '.' + key;
+      if (equal(value, base[key])) this._dirtyKeys.delete(id);
+      else this._dirtyKeys.add(id);
       this.emit();
     },
 
+    replaceConfig(next) {
+      this.config = next;
+      this._configStale = true;
+    },
+
     getField(section, key) {
       return (this.config[section] || {})[key];
     },
@@ -33,7 +45,8 @@ window.App = window.App || {};
     },
 
     configDirty() {
-      return !equal(this.config, this.baseline);
+      if (this._configStale) return !equal(this.config, this.baseline);
+      return this._dirtyKeys.size > 0;
     },
     dummyDirty() {
       return this.dummy != null && !equal(this.dummy, this.dummyBaseline);
@@ -51,12 +64,16 @@ window.App = window.App || {};
 
     commitConfig() {
       this.baseline = clone(this.config);
+      this._dirtyKeys.clear();
+      this._configStale = false;
     },
     commitDummy() {
       this.dummyBaseline = clone(this.dummy);
     },
     revert() {
       this.config = clone(this.baseline);
+      this._dirtyKeys.clear();
+      this._configStale = false;
       if (this.dummyBaseline != null) this.dummy = clone(this.dummyBaseline);
       this.emit();
     },
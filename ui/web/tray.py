@@ -134,6 +134,12 @@ _PAD_V = 10       # top/bottom padding inside the rounded body
 _MIN_W = 200      # minimum menu width
 _FONT_PT = 9
 
+# Restart glyph geometry is fixed, so its arc and arrowhead direction are
+# computed once here rather than on every menu repaint.
+_RESTART_START, _RESTART_SWEEP = 300.0, 300.0  # 60deg gap centered at the top
+_RESTART_COS = math.cos(math.radians(_RESTART_START + _RESTART_SWEEP))
+_RESTART_SIN = math.sin(math.radians(_RESTART_START + _RESTART_SWEEP))
+
 
 class _RECT(ctypes.Structure):
     _fields_ = [("left", wintypes.LONG), ("top", wintypes.LONG),
@@ -298,6 +304,7 @@ class Tray:
         self._menu_hover = -1
         self._menu_result: Optional[int] = None
         self._menu_done = True
+        self._menu_tracking = False  # a WM_MOUSELEAVE request is outstanding
 
     # -- public API (callable from any thread) ---------------------------
 
@@ -474,14 +481,13 @@ class Tray:
             g.GdipCreatePen1(_argb(color), width, _UNIT_PIXEL, ctypes.byref(pen))
             g.GdipSetPenStartCap(pen, _LINECAP_ROUND)
             r = size * 0.36
-            start, sweep = 300.0, 300.0  # 60deg gap centered at the top
-            g.GdipDrawArc(graphics, pen, cx - r, cy - r, 2 * r, 2 * r, start, sweep)
+            g.GdipDrawArc(graphics, pen, cx - r, cy - r, 2 * r, 2 * r,
+                          _RESTART_START, _RESTART_SWEEP)
             g.GdipDeletePen(pen)
             # Arrowhead at the leading (end) of the clockwise arc.
-            a = math.radians(start + sweep)
-            px, py = cx + r * math.cos(a), cy + r * math.sin(a)
-            tx, ty = -math.sin(a), math.cos(a)   # clockwise tangent
-            nx, ny = math.cos(a), math.sin(a)    # radial
+            nx, ny = _RESTART_COS, _RESTART_SIN  # radial
+            tx, ty = -ny, nx                     # clockwise tangent
+            px, py = cx + r * nx, cy + r * ny
             al, aw = size * 0.40, size * 0.40
             brush = ctypes.c_void_p()
             g.GdipCreateSolidFill(_argb(color), ctypes.byref(brush))
@@ -745,6 +751,7 @@ class Tray:
         self._menu_hover = -1
         self._menu_result = None
         self._menu_done = False
+        self._menu_tracking = False
 
         x, y = self._place(px, py, self._menu_w, self._menu_h)
         self._apply_frame(hwnd)
@@ -824,11 +831,17 @@ class Tray:
             k.Sleep(15)
 
     def _track_leave(self) -> None:
-        """Ask for a WM_MOUSELEAVE so hover clears when the cursor exits."""
+        """Ask for a WM_MOUSELEAVE so hover clears when the cursor exits.
+
+        One request covers the whole stay over the menu, so it's only re-armed
+        after the matching WM_MOUSELEAVE, not on every mouse move.
+        """
+        if self._menu_tracking:
+            return
         try:
             tme = _TRACKMOUSEEVENT(ctypes.sizeof(_TRACKMOUSEEVENT), _TME_LEAVE,
                                    self._menu_hwnd, 0)
-            ctypes.windll.user32.TrackMouseEvent(ctypes.byref(tme))
+            self._menu_tracking = bool(ctypes.windll.user32.TrackMouseEvent(ctypes.byref(tme)))
         except Exception:
             pass
 
@@ -870,6 +883,7 @@ class Tray:
             self._track_leave()
             return 0
         if msg == _WM_MOUSELEAVE:
+            self._menu_tracking = False
             self._set_hover(-1)  # cursor left the menu -> drop the highlight
             return 0
         if msg in (_WM_LBUTTONUP, _WM_RBUTTONUP):